@@ -1,26 +1,176 @@
 """Daily note creation and management for Coach AI."""
 
+import asyncio
 import os
 from datetime import datetime, date, timedelta
+from functools import lru_cache
+from itertools import islice
 from typing import Optional
-from difflib import SequenceMatcher
 
 import aiosqlite
-
-from coach_ai.obsidian import ObsidianVault
-from coach_ai.storage import get_db
+import frontmatter
+
+from coach_ai.obsidian import (
+    ObsidianVault,
+    _DAY_NAMES,
+    _MONTH_NAMES,
+    _clock_str,
+    _format_long_date,
+    _iso_date,
+)
+from coach_ai.storage import bulk_complete_todos, get_db
 from coach_ai.task_selection import select_tasks_for_today, increment_skip_counts
 
+try:
+    # Optional C-accelerated fuzzy matching; difflib is the fallback
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+except ImportError:
+    _rf_process = None
+
+
+# Priority markers used when rendering tasks from the daily note
+_PRIORITY_EMOJI = {"high": "🔴", "medium": "🟡", "low": "🔵"}
+
+# Context create_daily_note needs in one round-trip: up to 3 active goals
+# and the 5 most recent user facts. Each arm wraps its own ORDER BY/LIMIT in
+# a subquery so per-bucket ordering survives the UNION ALL.
+_NOTE_CONTEXT_SQL = """
+SELECT 'goal' AS src, goal AS fact, timeframe AS category
+FROM (SELECT goal, timeframe FROM goals WHERE status = 'active' LIMIT 3)
+UNION ALL
+SELECT 'fact', fact, category
+FROM (SELECT fact, category FROM user_facts ORDER BY created_at DESC LIMIT 5)
+"""
+
+# Everything start_my_day needs from the database in one round-trip: active
+# todos (for task selection) plus up to 3 active goals (for context), tagged
+# with a `src` column and partitioned back out in Python.
+_DAY_CONTEXT_SQL = """
+SELECT 'todo' AS src, id, title, priority, notes, time_estimate,
+       skipped_count, last_scheduled, created_at, tags, deadline_date
+FROM todos
+WHERE status = 'active'
+UNION ALL
+SELECT 'goal', NULL, goal, timeframe, NULL, NULL, NULL, NULL, created_at,
+       NULL, NULL
+FROM (SELECT goal, timeframe, created_at FROM goals
+      WHERE status = 'active' LIMIT 3)
+"""
+
+
+async def _fetchall(db: aiosqlite.Connection, sql: str) -> list:
+    """Execute a query and fetch all rows in one worker-thread hop."""
+    return await db.execute_fetchall(sql)
+
+
+# Cached result rows for the parameter-free context queries, keyed by SQL and
+# stamped with the connection's total_changes counter. Every INSERT/UPDATE/
+# DELETE through the shared connection bumps the counter, so goal/fact/todo
+# edits invalidate immediately — no TTL or cross-module bookkeeping needed.
+_query_cache: dict[str, tuple[int, list]] = {}
+
+
+async def _cached_fetchall(db: aiosqlite.Connection, sql: str) -> list:
+    """_fetchall memoized until the next write through this connection."""
+    changes = db.total_changes
+    cached = _query_cache.get(sql)
+    if cached is not None and cached[0] == changes:
+        return cached[1]
+
+    rows = await _fetchall(db, sql)
+    _query_cache[sql] = (changes, rows)
+    return rows
+
+
+@lru_cache(maxsize=32)
+def _parse_explicit_date(date_str: str) -> Optional[datetime]:
+    """Parse a YYYY-MM-DD string, or None if malformed.
+
+    Cached: tool calls within a session overwhelmingly repeat the same date
+    string, so after the first parse it's a dict hit. Only explicit strings
+    go through here — the empty-argument "today" case must never be cached.
+    """
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10]))
+        except ValueError:
+            pass
+    return None
+
+
+def _parse_date_arg(date_str: Optional[str]) -> tuple[Optional[datetime], Optional[str]]:
+    """Parse an optional YYYY-MM-DD tool argument.
+
+    Hand-rolled instead of strptime: every tool here pays date parsing per
+    call and strptime re-runs its format machinery each time. Also removes
+    the whole class of wrong-format-string bugs.
 
-# Global Obsidian vault connection
+    Returns:
+        (datetime, None) on success (now() when date_str is empty),
+        (None, error message) on malformed input
+    """
+    if not date_str:
+        return datetime.now(), None
+
+    parsed = _parse_explicit_date(date_str)
+    if parsed is not None:
+        return parsed, None
+
+    return None, f"❌ Invalid date format. Use YYYY-MM-DD, got: {date_str}"
+
+
+# Global Obsidian vault connection. The sentinel records that initialization
+# ran (successfully or not) so repeated calls skip the environ probe — MCP
+# server env is fixed at process start, so a failed init stays failed.
 _vault: Optional[ObsidianVault] = None
+_vault_initialized = False
+
+# Parsed daily-note cache keyed by (iso date, kind), storing (mtime_ns, data).
+# Entries are revalidated against the file's mtime so edits made in Obsidian
+# are picked up immediately; the cache only skips re-parsing unchanged notes.
+_note_cache: dict[tuple[str, str], tuple[int, dict]] = {}
+
+
+async def _cached_read(vault: ObsidianVault, date: datetime, kind: str = "parsed") -> Optional[dict]:
+    """Read a daily note through the mtime-validated cache.
+
+    Cache misses run the blocking open+parse in a worker thread so the event
+    loop keeps serving other MCP requests instead of stalling on file I/O.
+
+    Args:
+        vault: Obsidian vault instance
+        date: Date of the note
+        kind: 'parsed' for read_daily_note, 'full' for read_full_note
+
+    Returns:
+        Parsed note dict, or None if the note doesn't exist
+    """
+    note_path = vault.get_daily_note_path(date)
+    try:
+        mtime_ns = os.stat(note_path).st_mtime_ns
+    except OSError:
+        return None
+
+    key = (_iso_date(date), kind)
+    cached = _note_cache.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    reader = vault.read_full_note if kind == "full" else vault.read_daily_note
+    parsed = await asyncio.to_thread(reader, date)
+
+    if parsed is not None:
+        _note_cache[key] = (mtime_ns, parsed)
+
+    return parsed
 
 
 def get_vault() -> Optional[ObsidianVault]:
     """Get Obsidian vault connection if configured."""
-    global _vault
+    global _vault, _vault_initialized
 
-    if _vault is None:
+    if not _vault_initialized:
+        _vault_initialized = True
         vault_path = os.environ.get("OBSIDIAN_VAULT_PATH")
         if vault_path:
             daily_notes_format = os.environ.get(
@@ -30,7 +180,6 @@ def get_vault() -> Optional[ObsidianVault]:
                 _vault = ObsidianVault(vault_path, daily_notes_format)
             except ValueError as e:
                 print(f"Warning: Could not initialize Obsidian vault: {e}")
-                return None
 
     return _vault
 
@@ -60,100 +209,120 @@ async def start_my_day(date_str: str = None) -> str:
         return "❌ Obsidian vault not configured. Set OBSIDIAN_VAULT_PATH environment variable."
 
     # Parse date
-    if date_str:
-        try:
-            target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-        except ValueError:
-            return f"❌ Invalid date format. Use YYYY-MM-DD, got: {date_str}"
-    else:
-        target_date = date.today()
+    parsed, error = _parse_date_arg(date_str)
+    if error:
+        return error
+    target_date = parsed.date()
 
     db = await get_db()
 
-    # Build briefing
-    briefing = "=== 🌅 START MY DAY ===\n\n"
-    briefing += f"📅 {target_date.strftime('%A, %B %d, %Y')}\n\n"
+    # Build briefing as a list of parts; joined once at the end (str += is
+    # quadratic in the worst case on long briefings)
+    briefing = [
+        "=== 🌅 START MY DAY ===\n\n",
+        f"📅 {_format_long_date(target_date)}\n\n",
+    ]
+
+    # One directory listing answers both existence probes (yesterday's note
+    # for the sync, today's for creation) instead of a stat per date
+    have_notes = vault.existing_dates(target_date)
 
     # 1. Sync yesterday's note first (mark completed tasks)
     yesterday = target_date - timedelta(days=1)
-    if vault.daily_note_exists(datetime.combine(yesterday, datetime.min.time())):
+    if yesterday in have_notes:
         sync_result = await _sync_completed_tasks(vault, yesterday, db)
         if sync_result["completed_count"] > 0:
-            briefing += f"✅ Synced {sync_result['completed_count']} completed tasks from yesterday\n"
-            for task in sync_result["completed_tasks"][:3]:
-                briefing += f"   - {task}\n"
+            briefing.append(
+                f"✅ Synced {sync_result['completed_count']} completed tasks from yesterday\n"
+            )
+            briefing.extend(
+                f"   - {task}\n" for task in islice(sync_result["completed_tasks"], 3)
+            )
             if sync_result["completed_count"] > 3:
-                briefing += f"   ... and {sync_result['completed_count'] - 3} more\n"
-            briefing += "\n"
+                briefing.append(f"   ... and {sync_result['completed_count'] - 3} more\n")
+            briefing.append("\n")
+
+    # 2. Fetch todos + goals in a single round-trip, then run task selection
+    # on the pre-fetched todo rows. SQLite parses/locks once instead of twice;
+    # the goals lookup feeds the context section in step 5.
+    rows = await _cached_fetchall(db, _DAY_CONTEXT_SQL)
+    todo_rows = sorted(
+        (r for r in rows if r["src"] == "todo"), key=lambda r: r["created_at"]
+    )
+    goals = [
+        {"goal": r["title"], "timeframe": r["priority"]}
+        for r in rows
+        if r["src"] == "goal"
+    ]
 
-    # 2. Select tasks for today using smart algorithm
-    selected = await select_tasks_for_today(db, target_date, max_tasks=5)
+    selected = await select_tasks_for_today(
+        db, target_date, max_tasks=5, todos_rows=todo_rows
+    )
 
     total_selected = (
         len(selected["critical"]) + len(selected["important"]) + len(selected["quick_wins"])
     )
 
-    briefing += f"📋 Selected {total_selected} tasks from {selected['backlog_count']} in backlog\n\n"
+    briefing.append(
+        f"📋 Selected {total_selected} tasks from {selected['backlog_count']} in backlog\n\n"
+    )
 
     # 3. Create or update today's daily note
-    note_existed = vault.daily_note_exists(datetime.combine(target_date, datetime.min.time()))
+    note_existed = target_date in have_notes
 
     if not note_existed:
         # Create new note with selected tasks
         await _create_daily_note_with_tasks(vault, target_date, selected)
-        briefing += f"📝 Created today's daily note\n\n"
+        briefing.append("📝 Created today's daily note\n\n")
     else:
         # Note exists - could update it or leave as-is
-        briefing += f"📝 Daily note already exists\n\n"
+        briefing.append("📝 Daily note already exists\n\n")
 
     # 4. Show selected tasks in briefing
     if selected["critical"]:
-        briefing += "🎯 **CRITICAL (Do This First)**\n"
+        briefing.append("🎯 **CRITICAL (Do This First)**\n")
         for task in selected["critical"]:
-            briefing += f"   [{task['id']}] {task['title']}\n"
+            briefing.append(f"   [{task['id']}] {task['title']}\n")
             if task.get("notes"):
-                briefing += f"       Note: {task['notes'][:100]}\n"
-        briefing += "\n"
+                briefing.append(f"       Note: {task['notes'][:100]}\n")
+        briefing.append("\n")
 
     if selected["important"]:
-        briefing += "🔥 **IMPORTANT (Pick 1-2)**\n"
-        for task in selected["important"]:
-            briefing += f"   [{task['id']}] {task['title']}\n"
-        briefing += "\n"
+        briefing.append("🔥 **IMPORTANT (Pick 1-2)**\n")
+        briefing.extend(
+            f"   [{task['id']}] {task['title']}\n" for task in selected["important"]
+        )
+        briefing.append("\n")
 
     if selected["quick_wins"]:
-        briefing += "⚡ **QUICK WINS (Energy Permitting)**\n"
+        briefing.append("⚡ **QUICK WINS (Energy Permitting)**\n")
         for task in selected["quick_wins"]:
             time_str = f" ({task['time_estimate']}min)" if task.get("time_estimate") else ""
-            briefing += f"   [{task['id']}] {task['title']}{time_str}\n"
-        briefing += "\n"
-
-    # 5. Get active goals for context
-    goals_cursor = await db.execute(
-        "SELECT goal, timeframe FROM goals WHERE status = 'active' LIMIT 3"
-    )
-    goals = await goals_cursor.fetchall()
+            briefing.append(f"   [{task['id']}] {task['title']}{time_str}\n")
+        briefing.append("\n")
 
+    # 5. Show active goals for context (fetched above alongside task selection)
     if goals:
-        briefing += "🎯 **Active Goals**\n"
-        for goal in goals:
-            briefing += f"   - {goal['goal']} ({goal['timeframe']})\n"
-        briefing += "\n"
+        briefing.append("🎯 **Active Goals**\n")
+        briefing.extend(
+            f"   - {goal['goal']} ({goal['timeframe']})\n" for goal in goals
+        )
+        briefing.append("\n")
 
     # 6. Add note path
-    note_path = vault.get_daily_note_path(datetime.combine(target_date, datetime.min.time()))
-    briefing += f"📄 Daily note: {note_path}\n\n"
+    note_path = vault.get_daily_note_path(target_date)
+    briefing.append(f"📄 Daily note: {note_path}\n\n")
 
     # 7. Motivational message
     current_hour = datetime.now().hour
     if current_hour < 12:
-        briefing += "💪 Good morning! Start with the critical task or a quick win to build momentum.\n"
+        briefing.append("💪 Good morning! Start with the critical task or a quick win to build momentum.\n")
     elif current_hour < 17:
-        briefing += "💪 Afternoon check-in! Pick one task from the important section.\n"
+        briefing.append("💪 Afternoon check-in! Pick one task from the important section.\n")
     else:
-        briefing += "💪 Evening session! Focus on quick wins if energy is low.\n"
+        briefing.append("💪 Evening session! Focus on quick wins if energy is low.\n")
 
-    return briefing
+    return "".join(briefing)
 
 
 async def create_daily_note(date_str: str = None) -> str:
@@ -170,13 +339,9 @@ async def create_daily_note(date_str: str = None) -> str:
         return "❌ Obsidian vault not configured. Set OBSIDIAN_VAULT_PATH environment variable."
 
     # Parse date
-    if date_str:
-        try:
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
-            return f"❌ Invalid date format. Use YYYY-MM-DD, got: {date_str}"
-    else:
-        date = datetime.now()
+    date, error = _parse_date_arg(date_str)
+    if error:
+        return error
 
     # Check if note already exists
     if vault.daily_note_exists(date):
@@ -186,37 +351,34 @@ async def create_daily_note(date_str: str = None) -> str:
     # Generate smart content
     db = await get_db()
 
-    # 1. Get yesterday's incomplete tasks (if yesterday's note exists)
-    yesterday = date.replace(day=date.day - 1) if date.day > 1 else None
-    yesterday_tasks = []
-
-    if yesterday and vault.daily_note_exists(yesterday):
-        yesterday_note = vault.read_daily_note(yesterday)
-        if yesterday_note:
-            yesterday_tasks = [
-                task["text"]
-                for task in yesterday_note["tasks"]
-                if not task["completed"]
-            ]
-
-    # 2. Get goal-related tasks
-    goals_cursor = await db.execute(
-        "SELECT goal, timeframe FROM goals WHERE status = 'active' LIMIT 3"
+    # 1-3. Yesterday's note read and the goals/facts context query are
+    # independent (file I/O vs the database worker thread), so overlap them
+    # instead of paying the two latencies back to back.
+    yesterday = date - timedelta(days=1)
+    yesterday_note, rows = await asyncio.gather(
+        _cached_read(vault, yesterday), _cached_fetchall(db, _NOTE_CONTEXT_SQL)
     )
-    goals = await goals_cursor.fetchall()
 
-    # 3. Get user patterns for context
-    facts_cursor = await db.execute(
-        "SELECT fact, category FROM user_facts ORDER BY created_at DESC LIMIT 5"
-    )
-    facts = await facts_cursor.fetchall()
+    yesterday_tasks = []
+    if yesterday_note:
+        yesterday_tasks = [
+            task["text"]
+            for task in yesterday_note["tasks"]
+            if not task["completed"]
+        ]
+    goals = [
+        {"goal": r["fact"], "timeframe": r["category"]}
+        for r in rows
+        if r["src"] == "goal"
+    ]
+    facts = [r for r in rows if r["src"] == "fact"]
 
     # 4. Build tasks list
     tasks = []
 
     if yesterday_tasks:
         tasks.append("### Carried Over from Yesterday")
-        for task in yesterday_tasks[:3]:  # Limit to 3
+        for task in islice(yesterday_tasks, 3):  # Limit to 3
             tasks.append(task)
         tasks.append("")
 
@@ -234,7 +396,7 @@ async def create_daily_note(date_str: str = None) -> str:
     tasks_text = "\n".join(tasks) if tasks else None
 
     # 5. Generate focus
-    day_name = date.strftime("%A")
+    day_name = _DAY_NAMES[date.weekday()]
     if yesterday_tasks:
         focus = f"**Main Goal:** Continue momentum from yesterday\n**Backup Goal:** If stuck, work on goals instead"
     elif goals:
@@ -243,7 +405,8 @@ async def create_daily_note(date_str: str = None) -> str:
         focus = "**Main Goal:** Define your priorities for today\n**Backup Goal:** Review and set your goals"
 
     # 6. Generate quick win (lowest activation energy task)
-    current_hour = datetime.now().hour
+    now = datetime.now()
+    current_hour = now.hour
     is_late_start = current_hour > 10
     is_monday = day_name == "Monday"
 
@@ -255,10 +418,11 @@ async def create_daily_note(date_str: str = None) -> str:
     # 7. Generate context
     context_parts = []
 
-    if not vault.daily_note_exists(date):
-        context_parts.append(
-            "I noticed you haven't created your daily note yet, so I did it for you."
-        )
+    # The early return above already guaranteed the note doesn't exist yet,
+    # so no need to stat the file again here.
+    context_parts.append(
+        "I noticed you haven't created your daily note yet, so I did it for you."
+    )
 
     if yesterday_tasks:
         context_parts.append(
@@ -267,12 +431,12 @@ async def create_daily_note(date_str: str = None) -> str:
 
     if goals:
         context_parts.append(
-            f"I added tasks related to your active goals: {', '.join(g['goal'] for g in goals[:2])}."
+            f"I added tasks related to your active goals: {', '.join(g['goal'] for g in islice(goals, 2))}."
         )
 
     if facts:
         context_parts.append("\n**What I know about you:**")
-        for fact in facts[:3]:
+        for fact in islice(facts, 3):
             context_parts.append(f"- {fact['fact']}")
 
     if is_monday:
@@ -282,13 +446,15 @@ async def create_daily_note(date_str: str = None) -> str:
 
     if is_late_start:
         context_parts.append(
-            f"\n**Pattern note:** It's {datetime.now().strftime('%I:%M%p').lower()} - later than usual. No judgment! Let's start small."
+            f"\n**Pattern note:** It's {_clock_str(now)} - later than usual. No judgment! Let's start small."
         )
 
     context = "\n".join(context_parts) if context_parts else None
 
-    # Create the note
-    note_path = vault.create_daily_note(
+    # Create the note off the event loop — the write path serializes YAML
+    # and hits disk, which would otherwise stall concurrent MCP requests
+    note_path = await asyncio.to_thread(
+        vault.create_daily_note,
         date=date,
         focus=focus,
         quick_win=quick_win,
@@ -296,18 +462,18 @@ async def create_daily_note(date_str: str = None) -> str:
         context=context,
     )
 
-    result = f"✅ Created daily note: {note_path}\n\n"
+    result = [f"✅ Created daily note: {note_path}\n\n"]
 
     if yesterday_tasks:
-        result += f"📋 Carried over {len(yesterday_tasks)} tasks from yesterday\n"
+        result.append(f"📋 Carried over {len(yesterday_tasks)} tasks from yesterday\n")
 
     if goals:
-        result += f"🎯 Added tasks for {len(goals)} active goals\n"
+        result.append(f"🎯 Added tasks for {len(goals)} active goals\n")
 
-    result += f"\n⚡ Quick win to start: {quick_win}\n"
-    result += f"\n🎯 Today's focus:\n{focus}"
+    result.append(f"\n⚡ Quick win to start: {quick_win}\n")
+    result.append(f"\n🎯 Today's focus:\n{focus}")
 
-    return result
+    return "".join(result)
 
 
 async def sync_from_daily_note(date_str: str = None) -> str:
@@ -323,55 +489,48 @@ async def sync_from_daily_note(date_str: str = None) -> str:
     if not vault:
         return "❌ Obsidian vault not configured. Set OBSIDIAN_VAULT_PATH environment variable."
 
-    # Parse date
-    if date_str:
-        try:
-            date = datetime.strptime(date_str, "%Y-%M-%d")
-        except ValueError:
-            return f"❌ Invalid date format. Use YYYY-MM-DD, got: {date_str}"
-    else:
-        date = datetime.now()
+    # Parse date (this path previously used the buggy "%Y-%M-%d" format,
+    # which parses minutes where the month should be)
+    date, error = _parse_date_arg(date_str)
+    if error:
+        return error
 
     # Read note
-    note_data = vault.read_daily_note(date)
+    note_data = await _cached_read(vault, date)
 
     if not note_data:
-        return f"ℹ️  No daily note found for {date.strftime('%Y-%m-%d')}. Want me to create one?"
+        return f"ℹ️  No daily note found for {_iso_date(date)}. Want me to create one?"
 
     # Extract data
     tasks = note_data["tasks"]
     accomplishments = note_data["accomplishments"]
 
     # Build response
-    result = f"📖 Read daily note: {note_data['path']}\n\n"
+    result = [f"📖 Read daily note: {note_data['path']}\n\n"]
 
     if tasks:
         active_tasks = [t for t in tasks if not t["completed"]]
         completed_tasks = [t for t in tasks if t["completed"]]
 
-        result += f"**Active Tasks:** {len(active_tasks)}\n"
-        for task in active_tasks[:5]:  # Show first 5
-            priority_emoji = (
-                "🔴"
-                if task["priority"] == "high"
-                else "🟡" if task["priority"] == "medium" else "🔵"
-            )
-            result += f"{priority_emoji} {task['text']}\n"
+        result.append(f"**Active Tasks:** {len(active_tasks)}\n")
+        result.extend(
+            f"{_PRIORITY_EMOJI.get(task['priority'], '🔵')} {task['text']}\n"
+            for task in islice(active_tasks, 5)  # Show first 5
+        )
 
         if len(active_tasks) > 5:
-            result += f"... and {len(active_tasks) - 5} more\n"
+            result.append(f"... and {len(active_tasks) - 5} more\n")
 
-        result += f"\n**Completed Today:** {len(completed_tasks)}\n"
+        result.append(f"\n**Completed Today:** {len(completed_tasks)}\n")
 
     else:
-        result += "No tasks found in daily note.\n"
+        result.append("No tasks found in daily note.\n")
 
     if accomplishments:
-        result += f"\n**Accomplishments:** {len(accomplishments)}\n"
-        for acc in accomplishments[:3]:
-            result += f"✅ {acc}\n"
+        result.append(f"\n**Accomplishments:** {len(accomplishments)}\n")
+        result.extend(f"✅ {acc}\n" for acc in islice(accomplishments, 3))
 
-    return result
+    return "".join(result)
 
 
 async def get_daily_note_path(date_str: str = None) -> str:
@@ -387,19 +546,17 @@ async def get_daily_note_path(date_str: str = None) -> str:
     if not vault:
         return "❌ Obsidian vault not configured."
 
-    if date_str:
-        try:
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
-            return f"❌ Invalid date format: {date_str}"
-    else:
-        date = datetime.now()
+    date, error = _parse_date_arg(date_str)
+    if error:
+        return error
 
     note_path = vault.get_daily_note_path(date)
     exists = note_path.exists()
 
-    result = f"📄 Daily note path: {note_path}\n"
-    result += f"Status: {'✅ Exists' if exists else '❌ Does not exist'}\n"
+    result = (
+        f"📄 Daily note path: {note_path}\n"
+        f"Status: {'✅ Exists' if exists else '❌ Does not exist'}\n"
+    )
 
     if not exists:
         result += "\nWant me to create it? Just ask: 'Create my daily note'"
@@ -420,42 +577,39 @@ async def read_daily_note_full(date_str: str = None) -> str:
     if not vault:
         return "❌ Obsidian vault not configured."
 
-    if date_str:
-        try:
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
-            return f"❌ Invalid date format: {date_str}"
-    else:
-        date = datetime.now()
+    date, error = _parse_date_arg(date_str)
+    if error:
+        return error
 
-    note_data = vault.read_full_note(date)
+    note_data = await _cached_read(vault, date, kind="full")
 
     if not note_data:
-        return f"❌ No daily note found for {date.strftime('%Y-%m-%d')}."
+        return f"❌ No daily note found for {_iso_date(date)}."
 
-    result = f"📖 Daily Note: {note_data['path']}\n\n"
+    result = [f"📖 Daily Note: {note_data['path']}\n\n"]
 
     # Show metadata
     if note_data["metadata"]:
-        result += "**Metadata:**\n"
-        for key, value in note_data["metadata"].items():
-            result += f"  {key}: {value}\n"
-        result += "\n"
+        result.append("**Metadata:**\n")
+        result.extend(
+            f"  {key}: {value}\n" for key, value in note_data["metadata"].items()
+        )
+        result.append("\n")
 
     # Show all sections
-    result += "**Sections:**\n"
+    result.append("**Sections:**\n")
     for section_name, section_content in note_data["sections"].items():
-        result += f"\n### {section_name}\n"
+        result.append(f"\n### {section_name}\n")
         # Limit content display to avoid overwhelming output
         if len(section_content) > 500:
-            result += (
+            result.append(
                 section_content[:500]
                 + "...\n(content truncated, use read_daily_note_section for full text)"
             )
         else:
-            result += section_content + "\n"
+            result.append(section_content + "\n")
 
-    return result
+    return "".join(result)
 
 
 async def read_daily_note_section(date_str: str = None, section: str = "Notes") -> str:
@@ -472,18 +626,27 @@ async def read_daily_note_section(date_str: str = None, section: str = "Notes")
     if not vault:
         return "❌ Obsidian vault not configured."
 
-    if date_str:
-        try:
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
-            return f"❌ Invalid date format: {date_str}"
-    else:
-        date = datetime.now()
-
-    section_content = vault.read_section(date, section)
+    date, error = _parse_date_arg(date_str)
+    if error:
+        return error
+
+    # Serve the section from the shared full-note cache so a typical LLM turn
+    # (full read → section fetch → summary) parses the file once.
+    note_data = await _cached_read(vault, date, kind="full")
+
+    section_content = None
+    if note_data:
+        sections = note_data["sections"]
+        section_content = sections.get(section)
+        if section_content is None:
+            # Match section names case-insensitively, like vault.read_section
+            wanted = section.lower()
+            section_content = next(
+                (v for k, v in sections.items() if k.lower() == wanted), None
+            )
 
     if section_content is None:
-        return f"❌ Section '{section}' not found in daily note for {date.strftime('%Y-%m-%d')}."
+        return f"❌ Section '{section}' not found in daily note for {_iso_date(date)}."
 
     return f"## {section}\n\n{section_content}"
 
@@ -506,21 +669,21 @@ async def write_daily_note_section(
     if not vault:
         return "❌ Obsidian vault not configured."
 
-    if date_str:
-        try:
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
-            return f"❌ Invalid date format: {date_str}"
-    else:
-        date = datetime.now()
+    date, error = _parse_date_arg(date_str)
+    if error:
+        return error
 
-    success = vault.write_to_section(date, section, content, append=append)
+    # Read-modify-write of the note happens in a worker thread so the event
+    # loop keeps serving other requests
+    success = await asyncio.to_thread(
+        vault.write_to_section, date, section, content, append=append
+    )
 
     if not success:
         return f"❌ Failed to write to section '{section}'. Section may not exist."
 
     action = "Appended to" if append else "Updated"
-    return f"✅ {action} section '{section}' in daily note for {date.strftime('%Y-%m-%d')}."
+    return f"✅ {action} section '{section}' in daily note for {_iso_date(date)}."
 
 
 async def add_daily_note_section(
@@ -541,20 +704,18 @@ async def add_daily_note_section(
     if not vault:
         return "❌ Obsidian vault not configured."
 
-    if date_str:
-        try:
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
-            return f"❌ Invalid date format: {date_str}"
-    else:
-        date = datetime.now()
+    date, error = _parse_date_arg(date_str)
+    if error:
+        return error
 
-    success = vault.add_section(date, section_name, content, emoji=emoji)
+    success = await asyncio.to_thread(
+        vault.add_section, date, section_name, content, emoji=emoji
+    )
 
     if not success:
         return f"❌ Failed to add section '{section_name}'. Daily note may not exist."
 
-    return f"✅ Added new section '{section_name}' to daily note for {date.strftime('%Y-%m-%d')}."
+    return f"✅ Added new section '{section_name}' to daily note for {_iso_date(date)}."
 
 
 async def sync_daily_note(date_str: str = None) -> str:
@@ -574,31 +735,29 @@ async def sync_daily_note(date_str: str = None) -> str:
     if not vault:
         return "❌ Obsidian vault not configured."
 
-    if date_str:
-        try:
-            target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-        except ValueError:
-            return f"❌ Invalid date format: {date_str}"
-    else:
-        target_date = date.today()
+    parsed, error = _parse_date_arg(date_str)
+    if error:
+        return error
+    target_date = parsed.date()
 
     db = await get_db()
 
     sync_result = await _sync_completed_tasks(vault, target_date, db)
 
-    result = f"📝 Synced daily note for {target_date.strftime('%Y-%m-%d')}\n\n"
+    result = [f"📝 Synced daily note for {_iso_date(target_date)}\n\n"]
 
     if sync_result["completed_count"] > 0:
-        result += f"✅ Marked {sync_result['completed_count']} tasks complete:\n"
-        for task in sync_result["completed_tasks"]:
-            result += f"   - {task}\n"
+        result.append(f"✅ Marked {sync_result['completed_count']} tasks complete:\n")
+        result.extend(f"   - {task}\n" for task in sync_result["completed_tasks"])
     else:
-        result += "No new completed tasks found.\n"
+        result.append("No new completed tasks found.\n")
 
     if sync_result["warnings"]:
-        result += f"\n⚠️  {len(sync_result['warnings'])} checkboxes couldn't be matched to todos\n"
+        result.append(
+            f"\n⚠️  {len(sync_result['warnings'])} checkboxes couldn't be matched to todos\n"
+        )
 
-    return result
+    return "".join(result)
 
 
 async def _sync_completed_tasks(
@@ -609,7 +768,7 @@ async def _sync_completed_tasks(
     Returns:
         Dict with completed_count, completed_tasks list, and warnings
     """
-    note_data = vault.read_daily_note(datetime.combine(target_date, datetime.min.time()))
+    note_data = await _cached_read(vault, target_date)
 
     if not note_data:
         return {"completed_count": 0, "completed_tasks": [], "warnings": []}
@@ -627,26 +786,37 @@ async def _sync_completed_tasks(
     )
     active_todos = {row["id"]: row["title"] for row in await cursor.fetchall()}
 
+    # Normalize titles once for the whole batch of checkboxes instead of
+    # re-lowercasing every todo per checkbox
+    lowered_titles = {
+        tid: title.lower().strip() for tid, title in active_todos.items()
+    }
+    # Reverse index for the common case — the checkbox text is the todo title
+    # verbatim — so exact matches are one hash lookup, not a scan of the list
+    title_to_id = {title: tid for tid, title in lowered_titles.items()}
+
     completed_tasks = []
     warnings = []
+    matched_ids = []
 
     for checkbox in completed_checkboxes:
         checkbox_text = checkbox["text"]
+        checkbox_lower = checkbox_text.lower().strip()
 
-        # Try to match checkbox to a todo
-        matched_id = _fuzzy_match_task(checkbox_text, active_todos)
+        # Exact hit first; fall back to substring/fuzzy matching on a miss
+        matched_id = title_to_id.get(checkbox_lower)
+        if matched_id is None:
+            matched_id = _fuzzy_match_task(checkbox_lower, lowered_titles)
 
         if matched_id:
-            # Mark as complete
-            await db.execute(
-                "UPDATE todos SET status = 'completed', completed_at = ? WHERE id = ?",
-                (datetime.now().isoformat(), matched_id),
-            )
+            matched_ids.append(matched_id)
             completed_tasks.append(active_todos[matched_id])
         else:
             warnings.append(checkbox_text)
 
-    await db.commit()
+    # Mark all matches complete in a single UPDATE + commit rather than a
+    # writer-thread round-trip per row
+    await bulk_complete_todos(matched_ids)
 
     return {
         "completed_count": len(completed_tasks),
@@ -655,39 +825,45 @@ async def _sync_completed_tasks(
     }
 
 
-def _fuzzy_match_task(checkbox_text: str, todos: dict) -> Optional[int]:
+def _fuzzy_match_task(checkbox_lower: str, todos: dict) -> Optional[int]:
     """Match checkbox text to a todo using fuzzy matching.
 
+    The caller handles exact matches with a reverse-title dict, so this only
+    runs for misses. Uses RapidFuzz's C-accelerated batch scorer when
+    installed; otherwise falls back to a pure-Python SequenceMatcher loop.
+
     Args:
-        checkbox_text: Text from checkbox (e.g., "IMAGE_TAG env var")
-        todos: Dict of {id: title} for all active todos
+        checkbox_lower: Lowercased, stripped checkbox text
+        todos: Dict of {id: lowercased title} for all active todos
 
     Returns:
         ID of matched todo, or None if no good match
     """
-    best_match_id = None
-    best_ratio = 0.0
-
-    checkbox_lower = checkbox_text.lower().strip()
+    # Substring fast path
+    for todo_id, title_lower in todos.items():
+        if checkbox_lower in title_lower or title_lower in checkbox_lower:
+            return todo_id
 
-    for todo_id, todo_title in todos.items():
-        title_lower = todo_title.lower().strip()
+    # Fuzzy match: return best match if similarity > 70%
+    if _rf_process is not None:
+        match = _rf_process.extractOne(
+            checkbox_lower, todos, scorer=_rf_fuzz.ratio, score_cutoff=70
+        )
+        return match[2] if match else None
 
-        # Exact match
-        if checkbox_lower == title_lower:
-            return todo_id
+    # difflib is heavy to import; defer it so server cold start doesn't pay
+    # for it until the first sync actually needs fuzzy matching
+    from difflib import SequenceMatcher
 
-        # Substring match
-        if checkbox_lower in title_lower or title_lower in checkbox_lower:
-            return todo_id
+    best_match_id = None
+    best_ratio = 0.0
 
-        # Fuzzy match
+    for todo_id, title_lower in todos.items():
         ratio = SequenceMatcher(None, checkbox_lower, title_lower).ratio()
         if ratio > best_ratio:
             best_ratio = ratio
             best_match_id = todo_id
 
-    # Return best match if similarity > 70%
     if best_ratio > 0.7:
         return best_match_id
 
@@ -707,55 +883,50 @@ async def _create_daily_note_with_tasks(
     Returns:
         Path to created note
     """
-    # Build sections
-    critical_section = ""
+    # Build the note as a list of parts joined once; empty buckets add nothing
+    day_name = _DAY_NAMES[target_date.weekday()]
+    full_date = f"{_MONTH_NAMES[target_date.month]} {target_date.day:02d}, {target_date.year}"
+
+    parts = [f"# {day_name}, {full_date}\n\n"]
+
     if selected["critical"]:
-        critical_section = "## 🎯 Today's Focus (Pick 1)\n\n"
+        parts.append("## 🎯 Today's Focus (Pick 1)\n\n")
         for task in selected["critical"]:
-            critical_section += f"- [ ] {task['title']}\n"
+            parts.append(f"- [ ] {task['title']}\n")
             if task.get("notes"):
                 # Add notes as indented comment
-                for line in task["notes"].split("\n"):
-                    if line.strip():
-                        critical_section += f"  > {line}\n"
+                parts.extend(
+                    f"  > {line}\n"
+                    for line in task["notes"].split("\n")
+                    if line.strip()
+                )
+        parts.append("\n")
 
-    important_section = ""
     if selected["important"]:
-        important_section = "## 🔥 Important (Pick 1-2)\n\n"
-        for task in selected["important"]:
-            important_section += f"- [ ] {task['title']}\n"
+        parts.append("## 🔥 Important (Pick 1-2)\n\n")
+        parts.extend(f"- [ ] {task['title']}\n" for task in selected["important"])
+        parts.append("\n")
 
-    quick_wins_section = ""
     if selected["quick_wins"]:
-        quick_wins_section = "## ⚡ Quick Wins (Energy Permitting)\n\n"
+        parts.append("## ⚡ Quick Wins (Energy Permitting)\n\n")
         for task in selected["quick_wins"]:
             time_str = f" `{task['time_estimate']}min`" if task.get("time_estimate") else ""
-            quick_wins_section += f"- [ ] {task['title']}{time_str}\n"
-
-    # Build full content
-    day_name = target_date.strftime("%A")
-    full_date = target_date.strftime("%B %d, %Y")
-
-    content = f"# {day_name}, {full_date}\n\n"
-
-    if critical_section:
-        content += critical_section + "\n"
-    if important_section:
-        content += important_section + "\n"
-    if quick_wins_section:
-        content += quick_wins_section + "\n"
+            parts.append(f"- [ ] {task['title']}{time_str}\n")
+        parts.append("\n")
 
     # Add backlog count
     total_selected = (
         len(selected["critical"]) + len(selected["important"]) + len(selected["quick_wins"])
     )
     remaining = selected["backlog_count"] - total_selected
-    content += f"## 📋 Backlog\n\n"
-    content += f"<!-- {remaining} tasks remaining - run sync_daily_note to update -->\n\n"
+    parts.append("## 📋 Backlog\n\n")
+    parts.append(f"<!-- {remaining} tasks remaining - run sync_daily_note to update -->\n\n")
 
     # Add sections
-    content += "## 📝 Notes\n\n\n"
-    content += "## ✅ Completed Today\n\n<!-- Completed tasks will appear here -->\n"
+    parts.append("## 📝 Notes\n\n\n")
+    parts.append("## ✅ Completed Today\n\n<!-- Completed tasks will appear here -->\n")
+
+    content = "".join(parts)
 
     # Create note with frontmatter
     metadata = {
@@ -764,14 +935,20 @@ async def _create_daily_note_with_tasks(
         "day_of_week": day_name.lower(),
     }
 
-    import frontmatter
     post = frontmatter.Post(content, **metadata)
 
-    note_path = vault.get_daily_note_path(datetime.combine(target_date, datetime.min.time()))
-    note_path.parent.mkdir(parents=True, exist_ok=True)
+    note_path = vault.get_daily_note_path(target_date)
+
+    # YAML serialization plus the mkdir/write syscalls all block; run them in
+    # one worker-thread hop so the event loop keeps serving other requests.
+    # Write through the vault so its exists/parse caches pick the note up —
+    # existing_dates() has just seeded "no note today" for this exact path,
+    # and a raw write would leave that stale entry to shadow the new file.
+    def _serialize_and_write() -> None:
+        note_path.parent.mkdir(parents=True, exist_ok=True)
+        vault._write_post(note_path, post)
 
-    with open(note_path, "w", encoding="utf-8") as f:
-        f.write(frontmatter.dumps(post))
+    await asyncio.to_thread(_serialize_and_write)
 
     return str(note_path)
 
@@ -789,19 +966,15 @@ async def generate_daily_summary(date_str: str = None) -> str:
     if not vault:
         return "❌ Obsidian vault not configured."
 
-    if date_str:
-        try:
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
-            return f"❌ Invalid date format: {date_str}"
-    else:
-        date = datetime.now()
+    date, error = _parse_date_arg(date_str)
+    if error:
+        return error
 
     # Read full note
-    note_data = vault.read_full_note(date)
+    note_data = await _cached_read(vault, date, kind="full")
 
     if not note_data:
-        return f"❌ No daily note found for {date.strftime('%Y-%m-%d')}."
+        return f"❌ No daily note found for {_iso_date(date)}."
 
     # Extract key information
     tasks_section = note_data["sections"].get(
@@ -814,70 +987,75 @@ async def generate_daily_summary(date_str: str = None) -> str:
         "Notes", note_data["sections"].get("📝 Notes", "")
     )
 
-    # Parse tasks
+    # Parse tasks in one pass: check the line prefix once and slice off the
+    # 5-char checkbox marker instead of scanning + replacing per line
     completed_tasks = []
     incomplete_tasks = []
 
-    for line in tasks_section.split("\n"):
-        if "- [x]" in line:
-            completed_tasks.append(line.replace("- [x]", "").strip())
-        elif "- [ ]" in line:
-            incomplete_tasks.append(line.replace("- [ ]", "").strip())
+    for line in tasks_section.splitlines():
+        stripped = line.lstrip()
+        if stripped.startswith("- [x]"):
+            completed_tasks.append(stripped[5:].strip())
+        elif stripped.startswith("- [ ]"):
+            incomplete_tasks.append(stripped[5:].strip())
 
     # Build summary
-    summary = f"# Summary for {date.strftime('%A, %B %d, %Y')}\n\n"
+    summary = [f"# Summary for {_format_long_date(date)}\n\n"]
 
     # Completion stats
     total_tasks = len(completed_tasks) + len(incomplete_tasks)
     if total_tasks > 0:
         completion_rate = (len(completed_tasks) / total_tasks) * 100
-        summary += f"## 📊 Completion Rate: {completion_rate:.0f}%\n"
-        summary += f"- Completed: {len(completed_tasks)}/{total_tasks} tasks\n\n"
+        summary.append(f"## 📊 Completion Rate: {completion_rate:.0f}%\n")
+        summary.append(f"- Completed: {len(completed_tasks)}/{total_tasks} tasks\n\n")
     else:
-        summary += "## 📊 No tasks tracked today\n\n"
+        summary.append("## 📊 No tasks tracked today\n\n")
 
     # Accomplishments
     if completed_tasks or accomplishments_section.strip():
-        summary += "## ✅ What Went Well\n"
+        summary.append("## ✅ What Went Well\n")
         if completed_tasks:
-            for task in completed_tasks[:5]:
-                if task and not task.startswith("#"):
-                    summary += f"- {task}\n"
+            summary.extend(
+                f"- {task}\n"
+                for task in islice(completed_tasks, 5)
+                if task and not task.startswith("#")
+            )
         if accomplishments_section.strip():
-            summary += f"\n{accomplishments_section}\n"
-        summary += "\n"
+            summary.append(f"\n{accomplishments_section}\n")
+        summary.append("\n")
 
     # Incomplete tasks
     if incomplete_tasks:
-        summary += "## ⏸️ Carried Over\n"
-        summary += f"{len(incomplete_tasks)} tasks to consider for tomorrow:\n"
-        for task in incomplete_tasks[:3]:
-            if task and not task.startswith("#"):
-                summary += f"- {task}\n"
-        summary += "\n"
+        summary.append("## ⏸️ Carried Over\n")
+        summary.append(f"{len(incomplete_tasks)} tasks to consider for tomorrow:\n")
+        summary.extend(
+            f"- {task}\n"
+            for task in islice(incomplete_tasks, 3)
+            if task and not task.startswith("#")
+        )
+        summary.append("\n")
 
     # Key insights from notes
     if notes_section.strip():
-        summary += "## 💭 Key Notes\n"
+        summary.append("## 💭 Key Notes\n")
         # Take first few lines of notes as highlights
         note_lines = [
-            line.strip()
-            for line in notes_section.split("\n")
-            if line.strip() and not line.strip().startswith("<!--")
+            stripped
+            for line in notes_section.splitlines()
+            if (stripped := line.strip()) and not stripped.startswith("<!--")
         ]
-        for line in note_lines[:3]:
-            summary += f"- {line}\n"
-        summary += "\n"
+        summary.extend(f"- {line}\n" for line in islice(note_lines, 3))
+        summary.append("\n")
 
     # Recommendations
-    summary += "## 🎯 Recommendations\n"
+    summary.append("## 🎯 Recommendations\n")
     if len(incomplete_tasks) > 5:
-        summary += "- Consider breaking down or delegating some tasks - you have quite a few incomplete items\n"
+        summary.append("- Consider breaking down or delegating some tasks - you have quite a few incomplete items\n")
     if len(completed_tasks) > 3:
-        summary += "- Great productivity today! Maintain this momentum\n"
+        summary.append("- Great productivity today! Maintain this momentum\n")
     if not completed_tasks and not incomplete_tasks:
-        summary += "- Start tracking your tasks in the daily note for better visibility\n"
+        summary.append("- Start tracking your tasks in the daily note for better visibility\n")
 
-    summary += f"\n_Generated at {datetime.now().strftime('%I:%M%p').lower()}_"
+    summary.append(f"\n_Generated at {_clock_str(datetime.now())}_")
 
-    return summary
+    return "".join(summary)
@@ -9,6 +9,19 @@ async def migrate_database(db: aiosqlite.Connection) -> None:
     This function checks for and applies missing columns/tables
     to upgrade the database schema without losing data.
     """
+    # Tune the shared connection before anything else so migrations and all
+    # later queries benefit. WAL lets readers proceed during writes and
+    # synchronous=NORMAL drops the per-commit fsync (safe with WAL); the rest
+    # sizes the page cache, keeps temp structures in memory, waits out
+    # concurrent writers, and memory-maps the db file. All idempotent.
+    await db.execute("PRAGMA journal_mode=WAL")
+    await db.execute("PRAGMA synchronous=NORMAL")
+    await db.execute("PRAGMA cache_size=-65536")
+    await db.execute("PRAGMA temp_store=MEMORY")
+    await db.execute("PRAGMA busy_timeout=60000")
+    await db.execute("PRAGMA mmap_size=268435456")
+    await db.execute("PRAGMA journal_size_limit=6144000")
+
     # Check current schema version
     cursor = await db.execute(
         "SELECT name FROM sqlite_master WHERE type='table' AND name='schema_version'"
@@ -39,6 +52,31 @@ async def migrate_database(db: aiosqlite.Connection) -> None:
         await db.execute("INSERT INTO schema_version (version) VALUES (1)")
         await db.commit()
 
+    if current_version < 2:
+        await _migration_2_add_indexes(db)
+        await db.execute("INSERT INTO schema_version (version) VALUES (2)")
+        await db.commit()
+
+    if current_version < 3:
+        await _migration_3_add_priority_rank(db)
+        await db.execute("INSERT INTO schema_version (version) VALUES (3)")
+        await db.commit()
+
+    if current_version < 4:
+        await _migration_4_add_remaining_indexes(db)
+        await db.execute("INSERT INTO schema_version (version) VALUES (4)")
+        await db.commit()
+
+    if current_version < 5:
+        await _migration_5_add_tags_bitmask(db)
+        await db.execute("INSERT INTO schema_version (version) VALUES (5)")
+        await db.commit()
+
+    if current_version < 6:
+        await _migration_6_add_deadline_date(db)
+        await db.execute("INSERT INTO schema_version (version) VALUES (6)")
+        await db.commit()
+
 
 async def _migration_1_add_task_tracking(db: aiosqlite.Connection) -> None:
     """Migration 1: Add task tracking columns to todos table.
@@ -62,3 +100,143 @@ async def _migration_1_add_task_tracking(db: aiosqlite.Connection) -> None:
         await db.execute("ALTER TABLE todos ADD COLUMN last_scheduled DATE")
 
     await db.commit()
+
+
+async def _migration_2_add_indexes(db: aiosqlite.Connection) -> None:
+    """Migration 2: Index the hot filter columns.
+
+    Adds:
+    - idx_todos_status: every list/sync/selection path filters todos by status
+    - idx_todos_active_scheduled: partial index over active todos for the
+      last_scheduled bookkeeping (small — completed todos are excluded)
+    - idx_goals_status: the repeated status = 'active' goal lookups
+    - idx_user_facts_created_desc: top-K recent facts without a full sort
+    """
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_todos_status ON todos(status)"
+    )
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_todos_active_scheduled "
+        "ON todos(last_scheduled) WHERE status = 'active'"
+    )
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_goals_status ON goals(status)"
+    )
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_user_facts_created_desc "
+        "ON user_facts(created_at DESC)"
+    )
+
+    # Refresh planner statistics so the new indexes are actually used
+    await db.execute("ANALYZE")
+
+    await db.commit()
+
+
+async def _migration_3_add_priority_rank(db: aiosqlite.Connection) -> None:
+    """Migration 3: Store todo priority as a sortable integer rank.
+
+    ORDER BY CASE priority ... is evaluated per row and can't use an index.
+    A denormalized rank (high=1, medium=2, low=3) written at insert time,
+    plus a covering partial index over active todos, turns the priority
+    ordering into an index walk.
+    """
+    cursor = await db.execute("PRAGMA table_info(todos)")
+    columns = {row[1] for row in await cursor.fetchall()}
+
+    if "priority_rank" not in columns:
+        await db.execute(
+            "ALTER TABLE todos ADD COLUMN priority_rank INTEGER NOT NULL DEFAULT 2"
+        )
+        await db.execute(
+            """
+            UPDATE todos SET priority_rank =
+                CASE priority WHEN 'high' THEN 1 WHEN 'low' THEN 3 ELSE 2 END
+            """
+        )
+
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_todos_active_rank "
+        "ON todos(priority_rank, created_at) WHERE status = 'active'"
+    )
+
+    await db.execute("ANALYZE")
+
+    await db.commit()
+
+
+async def _migration_4_add_remaining_indexes(db: aiosqlite.Connection) -> None:
+    """Migration 4: Index the remaining recency-ordered lookups.
+
+    Adds:
+    - idx_accomplishments_created_desc: top-K recent wins for the
+      recommendation context and daily summaries
+    - idx_goals_status_created: goal listings filter by status and order by
+      created_at DESC; the composite index satisfies both without a sort
+    """
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_accomplishments_created_desc "
+        "ON accomplishments(created_at DESC)"
+    )
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_goals_status_created "
+        "ON goals(status, created_at DESC)"
+    )
+
+    await db.execute("ANALYZE")
+
+    await db.commit()
+
+
+async def _migration_5_add_tags_bitmask(db: aiosqlite.Connection) -> None:
+    """Migration 5: Store auto-detected category tags as an integer bitmask.
+
+    Task selection re-scanned notes for the "[Quick Win]"/"[Deadline]"/
+    "[Sprint Work]"/"[Management]" markers on every active row. The bits
+    (quick=1, deadline=2, sprint=4, management=8 — see the TAG_* constants
+    in storage.py) are written once at insert time instead; existing rows
+    are backfilled from their legacy note markers. The markers stay in the
+    notes text for display.
+    """
+    cursor = await db.execute("PRAGMA table_info(todos)")
+    columns = {row[1] for row in await cursor.fetchall()}
+
+    if "tags" not in columns:
+        await db.execute(
+            "ALTER TABLE todos ADD COLUMN tags INTEGER NOT NULL DEFAULT 0"
+        )
+        await db.execute(
+            """
+            UPDATE todos SET tags =
+                (notes LIKE '%[Quick Win]%') * 1
+                + (notes LIKE '%[Deadline]%') * 2
+                + (notes LIKE '%[Sprint Work]%') * 4
+                + (notes LIKE '%[Management]%') * 8
+            WHERE notes IS NOT NULL
+            """
+        )
+
+    await db.commit()
+
+
+async def _migration_6_add_deadline_date(db: aiosqlite.Connection) -> None:
+    """Migration 6: Store deadlines as a structured ISO date column.
+
+    add_todo writes the first YYYY-MM-DD date it finds in the title or
+    notes into deadline_date, so critical-task selection can compare one
+    string instead of regex-scanning free text. Legacy rows keep NULL —
+    selection still falls back to the notes scan for them — and the
+    partial index stays tiny because most todos have no deadline.
+    """
+    cursor = await db.execute("PRAGMA table_info(todos)")
+    columns = {row[1] for row in await cursor.fetchall()}
+
+    if "deadline_date" not in columns:
+        await db.execute("ALTER TABLE todos ADD COLUMN deadline_date TEXT")
+
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_todos_deadline "
+        "ON todos(deadline_date) WHERE deadline_date IS NOT NULL"
+    )
+
+    await db.commit()
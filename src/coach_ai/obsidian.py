@@ -2,13 +2,170 @@
 
 import os
 import re
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import frontmatter
 
 
+# Hot parsing patterns, compiled once at import instead of re-hashing the
+# pattern string through re's internal cache on every line
+_TASK_RE = re.compile(r"^- \[([ x])\] (.+)$")
+_TAG_RE = re.compile(r"#(\w+[-\w]*)")
+_LIST_ITEM_RE = re.compile(r"^[-*] (\[x\] )?")
+
+# Priority <-> tag lookup tables; a dict probe per tag replaces the chained
+# substring membership tests. High outranks low when a task carries both.
+_TAG_PRIORITY = {"high-priority": "high", "urgent": "high", "low-priority": "low"}
+_PRIORITY_TAG = {"high": " #high-priority", "low": " #low-priority"}
+_HEADING_RE = re.compile(r"^##\s+(?:[\U0001F300-\U0001F9FF]\s+)?(.+)$")
+
+# The headings this module itself writes, pre-resolved to the section name
+# the heading regex would produce (emoji in the \U0001F300-\U0001F9FF class
+# stripped, others kept). Notes we created hit this dict and never run the
+# regex; hand-edited headings still fall through to it.
+_HEADING_LOOKUP = {
+    "## 🎯 Focus for Today": "Focus for Today",
+    "## ⚡ Quick Win (Start Here)": "⚡ Quick Win (Start Here)",
+    "## ✅ Tasks": "✅ Tasks",
+    "## Tasks": "Tasks",
+    "## 💪 Accomplishments": "Accomplishments",
+    "## Accomplishments": "Accomplishments",
+    "## 📝 Notes": "Notes",
+    "## 🧠 Coach AI Insights": "Coach AI Insights",
+}
+
+# Day/month name lookup tables so the per-call date headers skip strftime's
+# format parsing and locale machinery
+_DAY_NAMES = (
+    "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"
+)
+_MONTH_NAMES = (
+    None, "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+
+
+def _format_long_date(d) -> str:
+    """Format a date/datetime like strftime's '%A, %B %d, %Y'."""
+    return f"{_DAY_NAMES[d.weekday()]}, {_MONTH_NAMES[d.month]} {d.day:02d}, {d.year}"
+
+
+def _iso_date(d) -> str:
+    """Format a date/datetime as YYYY-MM-DD without strftime's format parsing."""
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
+
+def _clock_str(dt: datetime) -> str:
+    """Format a time like strftime's '%I:%M%p' lowercased, e.g. '09:05am'."""
+    hour = dt.hour % 12 or 12
+    return f"{hour:02d}:{dt.minute:02d}{'am' if dt.hour < 12 else 'pm'}"
+
+
+def _fast_parse(text: str) -> Optional[frontmatter.Post]:
+    """Parse flat scalar frontmatter without going through PyYAML.
+
+    Notes written by this module carry a tiny fixed-shape header (date,
+    type, day_of_week — plain scalar strings), which str.partition handles
+    in a fraction of a full YAML load. Returns None whenever the header
+    doesn't have that shape (missing delimiter, nested/list/quoted/multi-line
+    values) so the caller can fall back to frontmatter.loads.
+    """
+    if not text.startswith("---\n"):
+        return None
+
+    end = text.find("\n---\n", 4)
+    if end == -1:
+        return None
+
+    metadata = {}
+    for line in text[4:end].splitlines():
+        if not line or line[0] in " \t#-":
+            return None
+        key, sep, value = line.partition(":")
+        value = value.strip()
+        if not sep or not value or value[0] in "[{|>&*":
+            return None
+        if value[0] in "\"'":
+            # Simple quoted scalar (the dumper quotes date-like strings);
+            # anything with embedded quotes or escapes takes the slow path
+            quote = value[0]
+            if len(value) < 2 or value[-1] != quote or quote in value[1:-1]:
+                return None
+            value = value[1:-1]
+        metadata[key.strip()] = value
+
+    return frontmatter.Post(text[end + 5:].lstrip("\n"), **metadata)
+
+
+def _atomic_write_text(path: Path, data: str) -> None:
+    """Write a file atomically: temp file, single write, fsync, os.replace.
+
+    os.replace has guaranteed atomic-overwrite semantics on every platform
+    (Path.rename raises on Windows when the target exists), the one os.write
+    of the full payload skips buffered small writes, and the fsync ensures
+    the rename can't land before the data does.
+    """
+    temp_path = str(path.with_suffix(".tmp"))
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data.encode("utf-8"))
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(temp_path, path)
+
+
+def _find_heading_line(content: str, headings: tuple[str, ...]) -> Optional[tuple[int, int]]:
+    """Locate the first column-0 "## " line whose stripped text is in `headings`.
+
+    Hops between heading lines with str.find (like _extract_section) so
+    mutators can splice around the match instead of splitting the whole note.
+
+    Returns:
+        (line_start, line_end) character offsets, or None. line_end is the
+        offset of the line's newline, or len(content) for the final line.
+    """
+    pos = 0
+    while True:
+        if pos == 0 and content.startswith("## "):
+            hit = 0
+        else:
+            hit = content.find("\n## ", pos)
+            if hit == -1:
+                return None
+            hit += 1
+        line_end = content.find("\n", hit)
+        if line_end == -1:
+            line_end = len(content)
+        if content[hit:line_end].strip() in headings:
+            return hit, line_end
+        pos = line_end
+
+
+@lru_cache(maxsize=128)
+def _format_note_path(vault_path: str, daily_notes_format: str, date_str: str) -> Path:
+    """Resolved note path for a date string, cached per (vault, format, date).
+
+    get_daily_note_path is called before every vault operation; the Path
+    construction and format substitution only ever produce a handful of
+    distinct results per session, so memoizing them skips the repeated
+    Path parsing/joining work.
+    """
+    return Path(vault_path) / daily_notes_format.replace("{date}", date_str)
+
+
+@lru_cache(maxsize=64)
+def _section_re(section_name: str) -> re.Pattern:
+    """Compiled heading matcher for a section, cached per section name."""
+    return re.compile(
+        rf"^##\s+(?:[\U0001F300-\U0001F9FF]\s+)?{re.escape(section_name)}\s*$",
+        re.IGNORECASE,
+    )
+
+
 class ObsidianVault:
     """Manages interactions with an Obsidian vault."""
 
@@ -22,14 +179,76 @@ class ObsidianVault:
         self.vault_path = Path(vault_path).expanduser()
         self.daily_notes_format = daily_notes_format
 
+        # Parsed frontmatter cache keyed by path, validated by mtime, so a
+        # flow that mutates the same note K times parses it once instead of K
+        self._post_cache: dict[Path, tuple[int, frontmatter.Post]] = {}
+
+        # Existence cache so repeated probes of the same note don't each pay
+        # a stat(2). Kept honest by every path that actually touches the
+        # filesystem: _load_post and _write_post restamp it, existing_dates
+        # seeds the whole window, invalidate() drops the entry.
+        self._exists_cache: dict[Path, bool] = {}
+
         if not self.vault_path.exists():
             raise ValueError(f"Vault path does not exist: {vault_path}")
 
-    def get_daily_note_path(self, date: datetime = None) -> Path:
+    def _load_post(self, note_path: Path) -> Optional[frontmatter.Post]:
+        """Load a note through the mtime-validated parse cache.
+
+        Returns:
+            The parsed Post, or None if the note doesn't exist
+        """
+        try:
+            mtime_ns = note_path.stat().st_mtime_ns
+        except OSError:
+            self._exists_cache[note_path] = False
+            return None
+
+        self._exists_cache[note_path] = True
+        cached = self._post_cache.get(note_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        with open(note_path, "r", encoding="utf-8") as f:
+            text = f.read()
+
+        # Fast path for the flat headers this module writes; anything more
+        # exotic goes through the real YAML parser
+        post = _fast_parse(text)
+        if post is None:
+            post = frontmatter.loads(text)
+
+        self._post_cache[note_path] = (mtime_ns, post)
+        return post
+
+    def _write_post(self, note_path: Path, post: frontmatter.Post) -> None:
+        """Atomically write a note and refresh the cache."""
+        _atomic_write_text(note_path, frontmatter.dumps(post))
+        self._exists_cache[note_path] = True
+
+        try:
+            self._post_cache[note_path] = (note_path.stat().st_mtime_ns, post)
+        except OSError:
+            self._post_cache.pop(note_path, None)
+
+    def _note_exists(self, note_path: Path) -> bool:
+        """Existence check through the cache; stats only on a miss."""
+        cached = self._exists_cache.get(note_path)
+        if cached is None:
+            cached = note_path.exists()
+            self._exists_cache[note_path] = cached
+        return cached
+
+    def invalidate(self, note_path: Path) -> None:
+        """Drop a cached parse (for files changed behind the vault's back)."""
+        self._post_cache.pop(note_path, None)
+        self._exists_cache.pop(note_path, None)
+
+    def get_daily_note_path(self, date: datetime | date = None) -> Path:
         """Get path to a daily note.
 
         Args:
-            date: Date for the note (defaults to today)
+            date: Date for the note, as a date or datetime (defaults to today)
 
         Returns:
             Path to the daily note file
@@ -37,15 +256,66 @@ class ObsidianVault:
         if date is None:
             date = datetime.now()
 
-        date_str = date.strftime("%Y-%m-%d")
-        note_path = self.daily_notes_format.replace("{date}", date_str)
-        return self.vault_path / note_path
+        return _format_note_path(str(self.vault_path), self.daily_notes_format, _iso_date(date))
 
-    def daily_note_exists(self, date: datetime = None) -> bool:
+    def daily_note_exists(self, date: datetime | date = None) -> bool:
         """Check if daily note exists for given date."""
-        return self.get_daily_note_path(date).exists()
+        return self._note_exists(self.get_daily_note_path(date))
+
+    def existing_dates(self, around: date = None, span: int = 2) -> set[date]:
+        """Find which dates near `around` already have a daily note.
 
-    def read_daily_note(self, date: datetime = None) -> Optional[dict]:
+        One os.scandir of the daily-notes directory answers existence for the
+        whole window, instead of a stat per probed date (noticeable on
+        network-mounted or sync-managed vaults).
+
+        Args:
+            around: Center of the window (defaults to today)
+            span: Days on each side of `around` to include
+
+        Returns:
+            Set of dates in the window whose daily note exists
+        """
+        if around is None:
+            around = datetime.now().date()
+
+        # Map candidate filenames to their dates; only candidates living in
+        # the same directory as `around`'s note can be answered by one listing.
+        # Formats that put {date} in a directory segment give every note its
+        # own parent — those candidates fall back to a stat each.
+        center_path = self.get_daily_note_path(around)
+        wanted = {}
+        fallback = []
+        for offset in range(-span, span + 1):
+            day = around + timedelta(days=offset)
+            path = self.get_daily_note_path(day)
+            if path.parent == center_path.parent:
+                wanted[path.name] = day
+            else:
+                fallback.append((path, day))
+
+        found = set()
+        try:
+            with os.scandir(center_path.parent) as entries:
+                for entry in entries:
+                    day = wanted.get(entry.name)
+                    if day is not None:
+                        found.add(day)
+        except FileNotFoundError:
+            pass
+
+        for path, day in fallback:
+            if self._note_exists(path):
+                found.add(day)
+
+        # Seed the existence cache for the whole window so follow-up probes
+        # of these dates are dict hits
+        for name, day in wanted.items():
+            self._exists_cache[center_path.parent / name] = day in found
+
+        return found
+
+    def read_daily_note(self, date: datetime | date = None) -> Optional[dict]:
         """Read and parse a daily note.
 
         Returns:
@@ -54,98 +324,130 @@ class ObsidianVault:
         """
         note_path = self.get_daily_note_path(date)
 
-        if not note_path.exists():
+        post = self._load_post(note_path)
+        if post is None:
             return None
 
-        with open(note_path, "r", encoding="utf-8") as f:
-            post = frontmatter.load(f)
-
-        # Parse tasks from content
-        tasks = self._extract_tasks(post.content)
-        accomplishments = self._extract_accomplishments(post.content)
+        parsed = self._parse_note(post.content)
 
         return {
             "path": str(note_path),
             "metadata": dict(post.metadata),
             "content": post.content,
-            "tasks": tasks,
-            "accomplishments": accomplishments,
+            "tasks": parsed["tasks"],
+            "accomplishments": parsed["accomplishments"],
         }
 
-    def _extract_tasks(self, content: str) -> list[dict]:
-        """Extract todo items from markdown content.
+    def _parse_note(self, content: str) -> dict:
+        """Parse sections, tasks and accomplishments in one pass.
 
-        Returns list of dicts with: text, completed, priority, tags
+        The note used to be walked once per extractor (sections, tasks,
+        accomplishments); this scans the lines a single time, dispatching on
+        the current heading, so each byte of the note is visited once.
+
+        Returns:
+            Dict with 'sections' (name -> content), 'tasks', 'accomplishments'
         """
-        tasks = []
-
-        # Find Tasks section
-        task_section = self._extract_section(content, "Tasks")
-        if not task_section:
-            task_section = self._extract_section(content, "✅ Tasks")
-
-        if not task_section:
-            return tasks
-
-        # Parse checkbox items
-        # Match: - [ ] Task text #tag #priority
-        # or:    - [x] Task text
-        pattern = r"^- \[([ x])\] (.+)$"
-
-        for line in task_section.split("\n"):
-            match = re.match(pattern, line.strip())
-            if match:
-                completed = match.group(1) == "x"
-                task_text = match.group(2).strip()
-
-                # Extract tags
-                tags = re.findall(r"#(\w+[-\w]*)", task_text)
-
-                # Extract priority from tags
-                priority = "medium"
-                if "high-priority" in tags or "urgent" in tags:
-                    priority = "high"
-                elif "low-priority" in tags:
-                    priority = "low"
-
-                # Remove tags from display text
-                clean_text = re.sub(r"\s*#\w+[-\w]*", "", task_text).strip()
-
-                tasks.append({
-                    "text": clean_text,
-                    "completed": completed,
-                    "priority": priority,
-                    "tags": tags,
-                    "raw": line.strip(),
-                })
-
-        return tasks
-
-    def _extract_accomplishments(self, content: str) -> list[str]:
-        """Extract accomplishments from the Accomplishments section."""
-        accomplishments = []
-
-        section = self._extract_section(content, "Accomplishments")
-        if not section:
-            section = self._extract_section(content, "💪 Accomplishments")
-
-        if not section:
-            return accomplishments
-
-        # Parse list items or checked items
-        for line in section.split("\n"):
-            line = line.strip()
-            if line.startswith("- ") or line.startswith("* "):
-                # Remove list marker and checkbox if present
-                text = re.sub(r"^[-*] (\[x\] )?", "", line).strip()
-                if text and not text.startswith("<!--"):
-                    accomplishments.append(text)
-
-        return accomplishments
+        sections: dict[str, str] = {}
+        tasks: list[dict] = []
+        accomplishments: list[str] = []
+
+        current_section = None
+        current_lines: list[str] = []
+        in_tasks = in_accomplishments = False
+
+        for line in content.splitlines():
+            # Cheap prefix reject, then the static-heading dict; only
+            # unrecognized "##" lines pay for the regex
+            if line.startswith("##"):
+                heading = _HEADING_LOOKUP.get(line)
+                if heading is None:
+                    heading_match = _HEADING_RE.match(line)
+                    if heading_match:
+                        heading = heading_match.group(1).strip()
+                if heading is not None:
+                    if current_section:
+                        sections[current_section] = "\n".join(current_lines).strip()
+                    current_section = heading
+                    current_lines = []
+                    lowered = current_section.lower()
+                    in_tasks = lowered in ("tasks", "✅ tasks")
+                    in_accomplishments = lowered in ("accomplishments", "💪 accomplishments")
+                    continue
+
+            if current_section:
+                current_lines.append(line)
+
+            if in_tasks:
+                stripped = line.strip()
+                # Cheap prefix reject so blanks, prose and comments skip the
+                # regex entirely (the accomplishments branch below already
+                # guards its re.sub the same way)
+                if not stripped.startswith("- ["):
+                    continue
+                match = _TASK_RE.match(stripped)
+                if match:
+                    task_text = match.group(2).strip()
+
+                    # Collect tags and build the stripped text in one regex
+                    # scan instead of a findall pass plus a sub pass; the
+                    # common untagged line skips regex work entirely
+                    tags: list[str] = []
+                    if "#" in task_text:
+                        clean_parts = []
+                        last = 0
+                        for tag in _TAG_RE.finditer(task_text):
+                            tags.append(tag.group(1))
+                            start = tag.start()
+                            while start > last and task_text[start - 1] in " \t":
+                                start -= 1
+                            clean_parts.append(task_text[last:start])
+                            last = tag.end()
+                        clean_parts.append(task_text[last:])
+                        clean_text = "".join(clean_parts).strip()
+                    else:
+                        clean_text = task_text
+
+                    priority = "medium"
+                    for tag in tags:
+                        mapped = _TAG_PRIORITY.get(tag)
+                        if mapped == "high":
+                            priority = "high"
+                            break
+                        if mapped:
+                            priority = mapped
+
+                    tasks.append({
+                        "text": clean_text,
+                        "completed": match.group(1) == "x",
+                        "priority": priority,
+                        "tags": tags,
+                        "raw": stripped,
+                    })
+            elif in_accomplishments:
+                stripped = line.strip()
+                if stripped.startswith("- ") or stripped.startswith("* "):
+                    text = _LIST_ITEM_RE.sub("", stripped).strip()
+                    if text and not text.startswith("<!--"):
+                        accomplishments.append(text)
+
+        if current_section:
+            sections[current_section] = "\n".join(current_lines).strip()
+
+        return {
+            "sections": sections,
+            "tasks": tasks,
+            "accomplishments": accomplishments,
+        }
 
     def _extract_section(self, content: str, section_name: str) -> Optional[str]:
         """Extract content of a markdown section by heading.
 
+        Walks "## " headings with str.find and slices to the next heading
+        instead of running a DOTALL regex over the whole note — the C-level
+        substring search visits far fewer bytes than the backtracking scan.
+        Matching stays case-insensitive and tolerates an emoji prefix.
+
         Args:
             content: Full markdown content
             section_name: Section heading to find (without ##)
@@ -153,20 +455,39 @@ class ObsidianVault:
         Returns:
             Content of that section, or None if not found
         """
-        # Match: ## Section Name or ## 🎯 Section Name
-        # Capture everything until next ## heading or end of file
-        pattern = rf"^##\s+(?:[\U0001F300-\U0001F9FF]\s+)?{re.escape(section_name)}\s*$(.+?)(?=^##\s|\Z)"
+        wanted = section_name.lower()
 
-        match = re.search(pattern, content, re.MULTILINE | re.DOTALL | re.IGNORECASE)
+        pos = 0
+        while True:
+            # Next "## " heading, at the start of the note or of a line
+            if content.startswith("## ", pos):
+                hit = pos
+            else:
+                hit = content.find("\n## ", pos)
+                if hit == -1:
+                    return None
+                hit += 1
 
-        if match:
-            return match.group(1).strip()
+            line_end = content.find("\n", hit)
+            if line_end == -1:
+                line_end = len(content)
 
-        return None
+            name = content[hit + 3:line_end].strip()
+            # Tolerate a single emoji prefix, e.g. "## 🎯 Focus"
+            if name and "\U0001F300" <= name[0] <= "\U0001F9FF":
+                name = name[1:].strip()
+
+            if name.lower() == wanted:
+                end = content.find("\n## ", line_end)
+                if end == -1:
+                    end = len(content)
+                return content[line_end:end].strip()
+
+            pos = line_end
 
     def create_daily_note(
         self,
-        date: datetime = None,
+        date: datetime | date = None,
         focus: str = None,
         quick_win: str = None,
         tasks: list[str] = None,
@@ -190,16 +511,16 @@ class ObsidianVault:
         note_path = self.get_daily_note_path(date)
 
         # Don't overwrite existing note
-        if note_path.exists():
+        if self._note_exists(note_path):
             return str(note_path)
 
         # Ensure directory exists
         note_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Generate content
-        day_name = date.strftime("%A")
-        full_date = date.strftime("%B %d, %Y")
-        date_str = date.strftime("%Y-%m-%d")
+        # Generate content (lookup tables instead of three strftime calls)
+        day_name = _DAY_NAMES[date.weekday()]
+        full_date = f"{_MONTH_NAMES[date.month]} {date.day:02d}, {date.year}"
+        date_str = _iso_date(date)
 
         # Build frontmatter
         metadata = {
@@ -247,7 +568,7 @@ class ObsidianVault:
         # Coach AI Insights
         if context:
             content_parts.append("## 🧠 Coach AI Insights")
-            content_parts.append(f"Created: {datetime.now().strftime('%I:%M%p').lower()}")
+            content_parts.append(f"Created: {_clock_str(datetime.now())}")
             content_parts.append("")
             content_parts.append(context)
             content_parts.append("")
@@ -257,12 +578,7 @@ class ObsidianVault:
         # Create frontmatter post
         post = frontmatter.Post(body, **metadata)
 
-        # Write atomically (temp file + rename)
-        temp_path = note_path.with_suffix(".tmp")
-        with open(temp_path, "w", encoding="utf-8") as f:
-            f.write(frontmatter.dumps(post))
-
-        temp_path.rename(note_path)
+        self._write_post(note_path, post)
 
         return str(note_path)
 
@@ -279,44 +595,33 @@ class ObsidianVault:
         """
         note_path = self.get_daily_note_path(date)
 
-        if not note_path.exists():
+        post = self._load_post(note_path)
+        if post is None:
             return False
 
-        with open(note_path, "r", encoding="utf-8") as f:
-            post = frontmatter.load(f)
-
         # Find and replace task
         checkbox = "[x]" if completed else "[ ]"
         old_checkbox = "[ ]" if completed else "[x]"
 
-        # Create pattern to find this specific task
-        # Match: - [ ] task_text or - [x] task_text
-        pattern = rf"^(- \[{re.escape(old_checkbox[1])}\] )({re.escape(task_text)}.*)$"
-
-        updated = False
-        new_lines = []
-
-        for line in post.content.split("\n"):
-            match = re.match(pattern, line)
-            if match and not updated:
-                # Replace checkbox
-                new_line = f"- {checkbox} {match.group(2)}"
-                new_lines.append(new_line)
-                updated = True
-            else:
-                new_lines.append(line)
-
-        if not updated:
-            return False
+        # Plain substring search beats building and running a regex per call:
+        # the target line starts with "- [ ] task_text" (trailing tags may
+        # follow), so locate that prefix at a line start and splice in the new
+        # checkbox — the rest of the line is untouched
+        content = post.content
+        needle = f"- {old_checkbox} {task_text}"
 
-        post.content = "\n".join(new_lines)
+        if content.startswith(needle):
+            idx = 0
+        else:
+            idx = content.find("\n" + needle)
+            if idx == -1:
+                return False
+            idx += 1
 
-        # Write atomically
-        temp_path = note_path.with_suffix(".tmp")
-        with open(temp_path, "w", encoding="utf-8") as f:
-            f.write(frontmatter.dumps(post))
+        # The checkbox occupies content[idx + 2 : idx + 5]
+        post.content = content[: idx + 2] + checkbox + content[idx + 5:]
 
-        temp_path.rename(note_path)
+        self._write_post(note_path, post)
 
         return True
 
@@ -335,69 +640,44 @@ class ObsidianVault:
         """
         note_path = self.get_daily_note_path(date)
 
-        if not note_path.exists():
+        post = self._load_post(note_path)
+        if post is None:
             # Create the note first
             self.create_daily_note(date, tasks=[task_text])
             return True
 
-        with open(note_path, "r", encoding="utf-8") as f:
-            post = frontmatter.load(f)
-
-        # Find Tasks section
+        # Find Tasks section, creating it at the end of the note if missing
         content = post.content
-        tasks_heading = "## ✅ Tasks"
-
-        if tasks_heading not in content:
-            tasks_heading = "## Tasks"
-            if tasks_heading not in content:
-                # Add tasks section
-                post.content += f"\n\n{tasks_heading}\n"
-
-        # Add priority tag
-        priority_tag = ""
-        if priority == "high":
-            priority_tag = " #high-priority"
-        elif priority == "low":
-            priority_tag = " #low-priority"
-
-        # Insert task under Tasks heading
-        new_task = f"- [ ] {task_text}{priority_tag}"
-
-        # Find insertion point (after Tasks heading)
-        lines = post.content.split("\n")
-        new_lines = []
-        inserted = False
-
-        for i, line in enumerate(lines):
-            new_lines.append(line)
-
-            if not inserted and (line.strip() == "## ✅ Tasks" or line.strip() == "## Tasks"):
-                # Insert after heading (and any existing tasks)
-                # Find where to insert based on priority
-                insert_index = i + 1
-
-                # Skip past higher priority tasks if this is medium/low
-                if priority != "high":
-                    while insert_index < len(lines) and lines[insert_index].strip().startswith("- [ ]"):
-                        if "#high-priority" not in lines[insert_index] or priority == "low":
-                            break
-                        insert_index += 1
-                        new_lines.append(lines[insert_index - 1])
-
-                new_lines.insert(insert_index, new_task)
-                inserted = True
-
-        if not inserted:
-            return False
-
-        post.content = "\n".join(new_lines)
-
-        # Write atomically
-        temp_path = note_path.with_suffix(".tmp")
-        with open(temp_path, "w", encoding="utf-8") as f:
-            f.write(frontmatter.dumps(post))
+        headings = ("## ✅ Tasks", "## Tasks")
+        loc = _find_heading_line(content, headings)
+        if loc is None:
+            content += "\n\n## Tasks\n"
+            loc = _find_heading_line(content, headings)
+
+        # Insert task under Tasks heading, tagged by priority
+        new_task = f"- [ ] {task_text}{_PRIORITY_TAG.get(priority, '')}"
+
+        # Splice at the computed offset — no split/join round-trip of the
+        # whole note for a one-line edit. Medium tasks go below existing
+        # high-priority ones; high and low insert right after the heading
+        # (low sinks naturally as others stack).
+        insert_at = loc[1] + 1
+        if priority == "medium":
+            while insert_at < len(content):
+                line_end = content.find("\n", insert_at)
+                if line_end == -1:
+                    line_end = len(content)
+                line = content[insert_at:line_end]
+                if not (line.strip().startswith("- [ ]") and "#high-priority" in line):
+                    break
+                insert_at = line_end + 1
+
+        if insert_at > len(content):
+            post.content = content + "\n" + new_task
+        else:
+            post.content = content[:insert_at] + new_task + "\n" + content[insert_at:]
 
-        temp_path.rename(note_path)
+        self._write_post(note_path, post)
 
         return True
 
@@ -413,56 +693,39 @@ class ObsidianVault:
         """
         note_path = self.get_daily_note_path(date)
 
-        if not note_path.exists():
+        post = self._load_post(note_path)
+        if post is None:
             return False
 
-        with open(note_path, "r", encoding="utf-8") as f:
-            post = frontmatter.load(f)
-
         # Find Accomplishments section
         content = post.content
-        accomplishments_heading = "## 💪 Accomplishments"
-
-        if accomplishments_heading not in content:
-            accomplishments_heading = "## Accomplishments"
-            if accomplishments_heading not in content:
-                return False
-
-        # Add accomplishment
-        timestamp = datetime.now().strftime("%I:%M%p").lower()
-        new_accomplishment = f"- {accomplishment} ({timestamp})"
-
-        # Insert after heading
-        lines = content.split("\n")
-        new_lines = []
-        inserted = False
-
-        for line in lines:
-            new_lines.append(line)
-
-            if not inserted and (
-                line.strip() == "## 💪 Accomplishments"
-                or line.strip() == "## Accomplishments"
-            ):
-                # Skip comment line if present
-                new_lines.append(new_accomplishment)
-                inserted = True
-
-        if not inserted:
+        loc = _find_heading_line(
+            content, ("## 💪 Accomplishments", "## Accomplishments")
+        )
+        if loc is None:
             return False
 
-        post.content = "\n".join(new_lines)
+        # Splice the new line in right after the heading — no split/join
+        # round-trip of the whole note
+        timestamp = _clock_str(datetime.now())
+        new_accomplishment = f"- {accomplishment} ({timestamp})"
 
-        # Write atomically
-        temp_path = note_path.with_suffix(".tmp")
-        with open(temp_path, "w", encoding="utf-8") as f:
-            f.write(frontmatter.dumps(post))
+        line_end = loc[1]
+        if line_end == len(content):
+            post.content = content + "\n" + new_accomplishment
+        else:
+            post.content = (
+                content[: line_end + 1]
+                + new_accomplishment
+                + "\n"
+                + content[line_end + 1:]
+            )
 
-        temp_path.rename(note_path)
+        self._write_post(note_path, post)
 
         return True
 
-    def read_full_note(self, date: datetime = None) -> Optional[dict]:
+    def read_full_note(self, date: datetime | date = None) -> Optional[dict]:
         """Read entire daily note including all content and metadata.
 
         Returns:
@@ -470,14 +733,12 @@ class ObsidianVault:
         """
         note_path = self.get_daily_note_path(date)
 
-        if not note_path.exists():
+        post = self._load_post(note_path)
+        if post is None:
             return None
 
-        with open(note_path, "r", encoding="utf-8") as f:
-            post = frontmatter.load(f)
-
         # Extract all sections
-        sections = self._parse_all_sections(post.content)
+        sections = self._parse_note(post.content)["sections"]
 
         return {
             "path": str(note_path),
@@ -486,41 +747,7 @@ class ObsidianVault:
             "sections": sections,
         }
 
-    def _parse_all_sections(self, content: str) -> dict[str, str]:
-        """Parse all markdown sections in the content.
-
-        Returns dict mapping section names to their content.
-        """
-        sections = {}
-
-        # Split by ## headings
-        lines = content.split("\n")
-        current_section = None
-        current_content = []
-
-        for line in lines:
-            # Check if this is a heading
-            heading_match = re.match(r"^##\s+(?:[\U0001F300-\U0001F9FF]\s+)?(.+)$", line)
-
-            if heading_match:
-                # Save previous section if exists
-                if current_section:
-                    sections[current_section] = "\n".join(current_content).strip()
-
-                # Start new section
-                current_section = heading_match.group(1).strip()
-                current_content = []
-            elif current_section:
-                # Add line to current section
-                current_content.append(line)
-
-        # Save last section
-        if current_section:
-            sections[current_section] = "\n".join(current_content).strip()
-
-        return sections
-
-    def read_section(self, date: datetime, section_name: str) -> Optional[str]:
+    def read_section(self, date: datetime | date, section_name: str) -> Optional[str]:
         """Read a specific section from the daily note.
 
         Args:
@@ -532,16 +759,14 @@ class ObsidianVault:
         """
         note_path = self.get_daily_note_path(date)
 
-        if not note_path.exists():
+        post = self._load_post(note_path)
+        if post is None:
             return None
 
-        with open(note_path, "r", encoding="utf-8") as f:
-            post = frontmatter.load(f)
-
         return self._extract_section(post.content, section_name)
 
     def write_to_section(
-        self, date: datetime, section_name: str, content: str, append: bool = False
+        self, date: datetime | date, section_name: str, content: str, append: bool = False
     ) -> bool:
         """Write or append content to a specific section.
 
@@ -556,68 +781,57 @@ class ObsidianVault:
         """
         note_path = self.get_daily_note_path(date)
 
-        if not note_path.exists():
-            return False
-
-        with open(note_path, "r", encoding="utf-8") as f:
-            post = frontmatter.load(f)
-
-        lines = post.content.split("\n")
-        new_lines = []
-        in_target_section = False
-        section_found = False
-        section_pattern = rf"^##\s+(?:[\U0001F300-\U0001F9FF]\s+)?{re.escape(section_name)}\s*$"
-
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-
-            # Check if we're at the target section
-            if re.match(section_pattern, line, re.IGNORECASE):
-                new_lines.append(line)
-                section_found = True
-                in_target_section = True
-
-                # Collect existing content until next section or end
-                existing_content = []
-                i += 1
-                while i < len(lines) and not lines[i].strip().startswith("## "):
-                    existing_content.append(lines[i])
-                    i += 1
-
-                # Write new content
-                if append:
-                    # Keep existing, add new
-                    new_lines.extend(existing_content)
-                    if existing_content and existing_content[-1].strip():
-                        new_lines.append("")  # Blank line before new content
-                    new_lines.append(content)
-                else:
-                    # Replace with new
-                    new_lines.append(content)
-
-                in_target_section = False
-                continue
-
-            new_lines.append(line)
-            i += 1
-
-        if not section_found:
+        post = self._load_post(note_path)
+        if post is None:
             return False
 
-        post.content = "\n".join(new_lines)
+        note = post.content
+        section_re = _section_re(section_name)
 
-        # Write atomically
-        temp_path = note_path.with_suffix(".tmp")
-        with open(temp_path, "w", encoding="utf-8") as f:
-            f.write(frontmatter.dumps(post))
+        # Locate the target heading by hopping column-0 "## " lines (like
+        # _extract_section) instead of rebuilding every line of the note
+        pos = 0
+        while True:
+            if pos == 0 and note.startswith("## "):
+                hit = 0
+            else:
+                hit = note.find("\n## ", pos)
+                if hit == -1:
+                    return False
+                hit += 1
+            line_end = note.find("\n", hit)
+            if line_end == -1:
+                line_end = len(note)
+            if section_re.match(note[hit:line_end]):
+                break
+            pos = line_end
+
+        # Section body runs to the next "## " heading or EOF; splice the new
+        # body in and leave the rest of the note untouched
+        next_heading = note.find("\n## ", line_end)
+        body_end = len(note) if next_heading == -1 else next_heading
+
+        if line_end == len(note):
+            # Heading is the last line of the note
+            post.content = note + "\n" + content
+        else:
+            body = note[line_end + 1:body_end]
+            if append:
+                existing = body.split("\n") if body else []
+                if existing and existing[-1].strip():
+                    existing.append("")  # Blank line before new content
+                existing.append(content)
+                new_body = "\n".join(existing)
+            else:
+                new_body = content
+            post.content = note[: line_end + 1] + new_body + note[body_end:]
 
-        temp_path.rename(note_path)
+        self._write_post(note_path, post)
 
         return True
 
     def add_section(
-        self, date: datetime, section_name: str, content: str, emoji: str = ""
+        self, date: datetime | date, section_name: str, content: str, emoji: str = ""
     ) -> bool:
         """Add a new section to the daily note.
 
@@ -632,23 +846,16 @@ class ObsidianVault:
         """
         note_path = self.get_daily_note_path(date)
 
-        if not note_path.exists():
+        post = self._load_post(note_path)
+        if post is None:
             return False
 
-        with open(note_path, "r", encoding="utf-8") as f:
-            post = frontmatter.load(f)
-
         # Add section at end
         heading = f"## {emoji} {section_name}" if emoji else f"## {section_name}"
         new_section = f"\n\n{heading}\n{content}"
 
         post.content += new_section
 
-        # Write atomically
-        temp_path = note_path.with_suffix(".tmp")
-        with open(temp_path, "w", encoding="utf-8") as f:
-            f.write(frontmatter.dumps(post))
-
-        temp_path.rename(note_path)
+        self._write_post(note_path, post)
 
         return True
@@ -2,6 +2,44 @@
 
 from coach_ai.storage import get_db
 
+# Everything the recommendation context needs in one round-trip to the
+# aiosqlite worker thread (which serializes queries, so four sequential
+# executes pay four queue hops). Arms are tagged with a src column and
+# partitioned back out in Python; column names come from the first arm, so
+# goals map onto title/priority/notes and facts/accomplishments onto title.
+_CONTEXT_SQL = """
+SELECT 'todo' AS src, id, title, priority, substr(notes, 1, 200) AS notes
+FROM (SELECT id, title, priority, notes FROM todos
+      WHERE status = 'active' ORDER BY priority_rank, created_at LIMIT 10)
+UNION ALL
+SELECT 'goal', NULL, goal, timeframe, category
+FROM (SELECT goal, timeframe, category FROM goals
+      WHERE status = 'active' ORDER BY created_at DESC LIMIT 10)
+UNION ALL
+SELECT 'fact', NULL, fact, category, NULL
+FROM (SELECT fact, category FROM user_facts
+      ORDER BY created_at DESC LIMIT 10)
+UNION ALL
+SELECT 'acc', NULL, description, NULL, NULL
+FROM (SELECT description FROM accomplishments
+      ORDER BY created_at DESC LIMIT 5)
+"""
+
+# Static instruction footer appended to every recommendation context.
+# Adjacent literals are concatenated at compile time; appending the single
+# constant avoids rebuilding the block per call.
+_RECOMMENDATION_FOOTER = (
+    "\n=== RECOMMENDATION REQUEST ===\n\n"
+    "Based on the above context, provide a specific, actionable recommendation for what "
+    "the user should focus on RIGHT NOW. Consider:\n"
+    "- Their priorities and goals\n"
+    "- Known patterns and preferences\n"
+    "- ADHD considerations (decision paralysis, activation energy, time blindness)\n"
+    "- The need for clear, concrete next steps\n"
+    "- Breaking down overwhelming tasks\n\n"
+    "If there are no active todos, encourage the user to add some or reflect on their goals."
+)
+
 
 async def get_recommendation() -> str:
     """Get a personalized recommendation for what to do next.
@@ -14,93 +52,61 @@ async def get_recommendation() -> str:
     """
     db = await get_db()
 
-    # Get active todos
-    todos_cursor = await db.execute(
-        """
-        SELECT id, title, priority, notes
-        FROM todos
-        WHERE status = 'active'
-        ORDER BY
-            CASE priority
-                WHEN 'high' THEN 1
-                WHEN 'medium' THEN 2
-                WHEN 'low' THEN 3
-            END,
-            created_at ASC
-        """
-    )
-    todos = await todos_cursor.fetchall()
-
-    # Get goals
-    goals_cursor = await db.execute(
-        "SELECT goal, timeframe, category FROM goals WHERE status = 'active' ORDER BY created_at DESC"
-    )
-    goals = await goals_cursor.fetchall()
+    rows = await db.execute_fetchall(_CONTEXT_SQL)
 
-    # Get user facts
-    facts_cursor = await db.execute(
-        "SELECT fact, category FROM user_facts ORDER BY created_at DESC LIMIT 10"
-    )
-    facts = await facts_cursor.fetchall()
-
-    # Get recent accomplishments
-    accomplishments_cursor = await db.execute(
-        "SELECT description, created_at FROM accomplishments ORDER BY created_at DESC LIMIT 5"
-    )
-    accomplishments = await accomplishments_cursor.fetchall()
+    # Each arm arrives pre-sorted and pre-limited, so partitioning is all
+    # that's left to do in Python
+    buckets = {"todo": [], "goal": [], "fact": [], "acc": []}
+    for row in rows:
+        buckets[row["src"]].append(row)
 
-    # Build comprehensive context
-    context = "=== CURRENT STATE FOR RECOMMENDATION ===\n\n"
+    todos = buckets["todo"]
+    goals = buckets["goal"]
+    facts = buckets["fact"]
+    accomplishments = buckets["acc"]
 
-    # Todos section
+    # Each section collapses to one block string via a generator fed straight
+    # to join; the final return is a single concatenation of five constants
+    # and four blocks — no incrementally grown buffer at all
     if todos:
-        context += "ACTIVE TODOS:\n"
-        for i, todo in enumerate(todos[:10], 1):  # Limit to top 10
-            context += f"  {i}. [{todo['id']}] {todo['title']} (priority: {todo['priority']})\n"
-            if todo["notes"]:
-                context += f"      Notes: {todo['notes']}\n"
+        todos_block = "ACTIVE TODOS:\n" + "".join(
+            f"  {i}. [{todo['id']}] {todo['title']} (priority: {todo['priority']})\n"
+            + (f"      Notes: {todo['notes']}\n" if todo["notes"] else "")
+            for i, todo in enumerate(todos, 1)  # SQL already limits to top 10
+        )
     else:
-        context += "ACTIVE TODOS: None\n"
+        todos_block = "ACTIVE TODOS: None\n"
 
-    context += "\n"
-
-    # Goals section
     if goals:
-        context += "ACTIVE GOALS:\n"
-        for goal in goals:
-            context += f"  - {goal['goal']} ({goal['timeframe']}, {goal['category']})\n"
+        goals_block = "ACTIVE GOALS:\n" + "".join(
+            f"  - {goal['title']} ({goal['priority']}, {goal['notes']})\n"
+            for goal in goals
+        )
     else:
-        context += "ACTIVE GOALS: None set yet\n"
-
-    context += "\n"
+        goals_block = "ACTIVE GOALS: None set yet\n"
 
-    # User context section
     if facts:
-        context += "KNOWN ABOUT USER:\n"
-        for fact in facts:
-            context += f"  - {fact['fact']} ({fact['category']})\n"
+        facts_block = "KNOWN ABOUT USER:\n" + "".join(
+            f"  - {fact['title']} ({fact['priority']})\n" for fact in facts
+        )
     else:
-        context += "KNOWN ABOUT USER: Learning about you as we go\n"
-
-    context += "\n"
+        facts_block = "KNOWN ABOUT USER: Learning about you as we go\n"
 
-    # Recent wins section
     if accomplishments:
-        context += "RECENT ACCOMPLISHMENTS:\n"
-        for acc in accomplishments:
-            context += f"  - {acc['description']}\n"
-
-    context += "\n"
-    context += "=== RECOMMENDATION REQUEST ===\n\n"
-    context += (
-        "Based on the above context, provide a specific, actionable recommendation for what "
-        "the user should focus on RIGHT NOW. Consider:\n"
-        "- Their priorities and goals\n"
-        "- Known patterns and preferences\n"
-        "- ADHD considerations (decision paralysis, activation energy, time blindness)\n"
-        "- The need for clear, concrete next steps\n"
-        "- Breaking down overwhelming tasks\n\n"
-        "If there are no active todos, encourage the user to add some or reflect on their goals."
+        wins_block = "RECENT ACCOMPLISHMENTS:\n" + "".join(
+            f"  - {acc['title']}\n" for acc in accomplishments
+        )
+    else:
+        wins_block = ""
+
+    return (
+        "=== CURRENT STATE FOR RECOMMENDATION ===\n\n"
+        + todos_block
+        + "\n"
+        + goals_block
+        + "\n"
+        + facts_block
+        + "\n"
+        + wins_block
+        + _RECOMMENDATION_FOOTER
     )
-
-    return context
@@ -1,5 +1,7 @@
 """Coach AI MCP Server - ADHD coaching assistant."""
 
+import asyncio
+
 from mcp.server.fastmcp import FastMCP
 
 from coach_ai import daily_notes, recommendations, storage
@@ -329,7 +331,12 @@ async def generate_daily_summary(date_str: str = None) -> str:
 
 def main():
     """Main entry point for the MCP server."""
-    mcp.run(transport="stdio")
+    try:
+        mcp.run(transport="stdio")
+    finally:
+        # Refresh planner stats and close the shared connection on the way
+        # out (no-op if no tool ever touched the database)
+        asyncio.run(storage.close_db())
 
 
 if __name__ == "__main__":
@@ -1,8 +1,11 @@
 """Database storage layer for Coach AI."""
 
+import asyncio
 import os
 import re
+from contextlib import asynccontextmanager
 from datetime import date
+from itertools import groupby
 from pathlib import Path
 from typing import Optional
 
@@ -11,67 +14,183 @@ import aiosqlite
 from coach_ai.migrations import migrate_database
 
 
-# Global database connection
+# Base schema, applied once on first connect (columns added later live in
+# migrations.py)
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS todos (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    priority TEXT DEFAULT 'medium',
+    notes TEXT,
+    status TEXT DEFAULT 'active',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    completed_at TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS goals (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    goal TEXT NOT NULL,
+    timeframe TEXT,
+    category TEXT DEFAULT 'general',
+    status TEXT DEFAULT 'active',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS user_facts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    fact TEXT NOT NULL,
+    category TEXT DEFAULT 'general',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS accomplishments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    description TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+# Global database connection; _init_lock serializes cold-start so concurrent
+# first callers can't connect and run the DDL twice
 _db: Optional[aiosqlite.Connection] = None
+_init_lock = asyncio.Lock()
+
+# Sortable rank stored alongside the priority text (see migration 3)
+_PRIORITY_RANK = {"high": 1, "medium": 2, "low": 3}
+
+_VALID_PRIORITIES = frozenset(_PRIORITY_RANK)
+
+# Category tag bits stored in todos.tags (migration 5); the bracketed
+# markers in notes remain the human-readable form of the same flags
+TAG_QUICK_WIN = 1
+TAG_DEADLINE = 2
+TAG_SPRINT = 4
+TAG_MANAGEMENT = 8
+
+# Time estimates embedded in notes, e.g. "30min", "2h", "1hr"
+_TIME_RE = re.compile(r"(\d+)\s*(min|mins|minute|minutes|h|hr|hrs|hour|hours)")
+
+# Structured deadline extraction: first ISO date in the title or notes is
+# stored in todos.deadline_date (migration 6) so selection can compare one
+# string instead of scanning free text
+_DEADLINE_RE = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
+
+# All auto-categorization keywords as one alternation; a single C-level scan
+# tags every category at once instead of a Python substring loop per keyword.
+# The named group of each match says which category fired.
+_CATEGORY_RE = re.compile(
+    r"(?P<sprint>sprint|sidecar|migration)"
+    r"|(?P<mgmt>korosh|manager|presentation|meeting)"
+    r"|(?P<deadline>deadline|due)"
+    r"|(?P<quick>quick|easy)"
+)
+
+# Hot-path statement text, hoisted so every call passes the same string
+# object to sqlite3's per-connection statement cache
+_SQL_INSERT_TODO = (
+    "INSERT INTO todos (title, priority, priority_rank, notes, time_estimate,"
+    " tags, deadline_date) VALUES (?, ?, ?, ?, ?, ?, ?) RETURNING id"
+)
+_SQL_LIST_TODOS_ALL = (
+    "SELECT id, title, priority, notes FROM todos"
+    " ORDER BY priority_rank, created_at DESC"
+)
+_SQL_LIST_TODOS_BY_STATUS = (
+    "SELECT id, title, priority, notes FROM todos WHERE status = ?"
+    " ORDER BY priority_rank, created_at DESC"
+)
+_SQL_COMPLETE_TODO = (
+    "UPDATE todos SET status = 'completed', completed_at = CURRENT_TIMESTAMP"
+    " WHERE id = ? RETURNING title"
+)
+_SQL_DELETE_TODO = "DELETE FROM todos WHERE id = ? RETURNING title"
+_SQL_LIST_GOALS_ALL = (
+    "SELECT id, goal, timeframe, category FROM goals ORDER BY created_at DESC"
+)
+_SQL_LIST_GOALS_BY_STATUS = (
+    "SELECT id, goal, timeframe, category FROM goals WHERE status = ?"
+    " ORDER BY created_at DESC"
+)
+_SQL_RECENT_FACTS = (
+    "SELECT fact, category FROM user_facts ORDER BY created_at DESC LIMIT 20"
+)
+
+# Formatted-listing cache, stamped with db.total_changes at read time: any
+# write through the shared connection bumps the counter and invalidates every
+# entry, so a hit is provably as fresh as re-running the query (same scheme
+# as the daily_notes query cache)
+_result_cache: dict = {}
 
 
 async def get_db() -> aiosqlite.Connection:
     """Get or create database connection."""
     global _db
 
-    if _db is None:
-        # Determine database path
-        db_path = os.environ.get("COACH_DB_PATH", "data/coach.db")
-        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-
-        # Connect to database
-        _db = await aiosqlite.connect(db_path)
-        _db.row_factory = aiosqlite.Row
-
-        # Initialize schema
-        await _db.executescript(
-            """
-            CREATE TABLE IF NOT EXISTS todos (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                priority TEXT DEFAULT 'medium',
-                notes TEXT,
-                status TEXT DEFAULT 'active',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                completed_at TIMESTAMP
-            );
-
-            CREATE TABLE IF NOT EXISTS goals (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                goal TEXT NOT NULL,
-                timeframe TEXT,
-                category TEXT DEFAULT 'general',
-                status TEXT DEFAULT 'active',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-
-            CREATE TABLE IF NOT EXISTS user_facts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                fact TEXT NOT NULL,
-                category TEXT DEFAULT 'general',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-
-            CREATE TABLE IF NOT EXISTS accomplishments (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                description TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-            """
-        )
-        await _db.commit()
+    # Fast path: once initialized, every call returns without touching the lock
+    if _db is not None:
+        return _db
+
+    async with _init_lock:
+        if _db is None:
+            # Determine database path
+            db_path = os.environ.get("COACH_DB_PATH", "data/coach.db")
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+            # Connect and initialize; assign the global only after the schema
+            # and migrations are in place so a concurrent caller on the fast
+            # path never sees a half-initialized connection
+            db = await aiosqlite.connect(db_path)
+            db.row_factory = aiosqlite.Row
+
+            await db.executescript(_SCHEMA_SQL)
+            await db.commit()
 
-        # Run migrations
-        await migrate_database(_db)
+            await migrate_database(db)
+
+            _db = db
 
     return _db
 
 
+@asynccontextmanager
+async def transaction(db: aiosqlite.Connection):
+    """Run a block of writes as one explicit transaction.
+
+    BEGIN IMMEDIATE takes the write lock up front so the batch can't be
+    starved mid-way; the block's statements then share a single commit
+    (one fsync) instead of autocommitting per statement. Rolls back and
+    re-raises on any exception.
+    """
+    await db.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        await db.execute("ROLLBACK")
+        raise
+    else:
+        await db.execute("COMMIT")
+
+
+async def close_db() -> None:
+    """Close the database connection, refreshing planner stats first.
+
+    PRAGMA optimize is SQLite's recommended on-close hook: it re-analyzes
+    only the tables whose statistics have drifted, so the next startup's
+    query plans stay good as the tables grow.
+    """
+    global _db
+
+    if _db is None:
+        return
+
+    try:
+        await _db.execute("PRAGMA optimize")
+        await _db.commit()
+    finally:
+        db, _db = _db, None
+        await db.close()
+
+
 # ============================================================================
 # TODO OPERATIONS
 # ============================================================================
@@ -94,7 +213,7 @@ async def add_todo(
     db = await get_db()
 
     # Validate priority
-    if priority not in ["low", "medium", "high"]:
+    if priority not in _VALID_PRIORITIES:
         priority = "medium"
 
     # Auto-categorization based on keywords
@@ -102,24 +221,43 @@ async def add_todo(
     title_lower = title.lower()
     notes_lower = notes.lower()
 
-    # Category detection
-    if any(keyword in title_lower for keyword in ["sprint", "sidecar", "migration"]):
+    # Category detection: one alternation scan over both fields joined with a
+    # NUL (which no keyword can match across). The match offset says which
+    # field fired — sprint/management keywords only count in the title,
+    # deadline/quick match anywhere.
+    haystack = f"{title_lower}\0{notes_lower}"
+    title_len = len(title_lower)
+    flags = set()
+    for match in _CATEGORY_RE.finditer(haystack):
+        group = match.lastgroup
+        if group in ("deadline", "quick") or match.start() < title_len:
+            flags.add(group)
+
+    # Structured deadline: first ISO date mentioned anywhere in the text
+    deadline_match = _DEADLINE_RE.search(haystack)
+    deadline_date = deadline_match.group(1) if deadline_match else None
+
+    tags = 0
+    if "sprint" in flags:
         auto_notes.append("[Sprint Work]")
-    if any(keyword in title_lower for keyword in ["korosh", "manager", "presentation", "meeting"]):
+        tags |= TAG_SPRINT
+    if "mgmt" in flags:
         auto_notes.append("[Management]")
-    if any(keyword in title_lower or keyword in notes_lower for keyword in ["deadline", "due"]):
+        tags |= TAG_MANAGEMENT
+    if "deadline" in flags:
         auto_notes.append("[Deadline]")
+        tags |= TAG_DEADLINE
 
     # Quick win handling
     time_estimate = None
-    if quick or any(keyword in title_lower or keyword in notes_lower for keyword in ["quick", "easy"]):
+    if quick or "quick" in flags:
         priority = "low"  # Quick wins are low priority for selection
         auto_notes.append("[Quick Win]")
+        tags |= TAG_QUICK_WIN
         time_estimate = 15  # Default 15 minutes for quick wins
 
     # Extract time estimates from notes (e.g., "30min", "2h", "1hr")
-    time_pattern = r"(\d+)\s*(min|mins|minute|minutes|h|hr|hrs|hour|hours)"
-    time_match = re.search(time_pattern, notes_lower)
+    time_match = _TIME_RE.search(notes_lower)
     if time_match and not time_estimate:
         amount = int(time_match.group(1))
         unit = time_match.group(2)
@@ -129,8 +267,9 @@ async def add_todo(
             time_estimate = amount
 
         # Mark as quick win if under 30 minutes
-        if time_estimate <= 30 and "[Quick Win]" not in auto_notes:
+        if time_estimate <= 30 and not tags & TAG_QUICK_WIN:
             auto_notes.append("[Quick Win]")
+            tags |= TAG_QUICK_WIN
 
     # Combine notes
     enhanced_notes = notes
@@ -138,20 +277,26 @@ async def add_todo(
         prefix = " ".join(auto_notes)
         enhanced_notes = f"{prefix}\n{notes}" if notes else prefix
 
-    # Insert todo
-    await db.execute(
-        "INSERT INTO todos (title, priority, notes, time_estimate) VALUES (?, ?, ?, ?)",
-        (title, priority, enhanced_notes, time_estimate),
+    # Insert todo; RETURNING id folds the last_insert_rowid() lookup into
+    # the insert itself
+    cursor = await db.execute(
+        _SQL_INSERT_TODO,
+        (
+            title,
+            priority,
+            _PRIORITY_RANK[priority],
+            enhanced_notes,
+            time_estimate,
+            tags,
+            deadline_date,
+        ),
     )
-    await db.commit()
-
-    # Get the ID of inserted todo
-    cursor = await db.execute("SELECT last_insert_rowid()")
     row = await cursor.fetchone()
     todo_id = row[0]
+    await db.commit()
 
     result = f"✓ Added todo #{todo_id}: {title}"
-    if quick or "[Quick Win]" in auto_notes:
+    if quick or tags & TAG_QUICK_WIN:
         result += " (quick win)"
     result += f"\n  Priority: {priority}"
     if time_estimate:
@@ -161,51 +306,69 @@ async def add_todo(
     return result
 
 
-async def list_todos(status: str = "active") -> str:
-    """List todos filtered by status.
+async def query_todos(status: str = "active") -> list:
+    """Fetch todo rows for programmatic callers.
+
+    Returns (id, title, priority, notes) rows sorted by priority rank then
+    recency — the same rows list_todos formats, without the formatting.
+    priority_rank sorts high -> low; the old ORDER BY priority DESC compared
+    the text labels alphabetically (medium before low before high).
 
     Args:
         status: Filter by 'active', 'completed', or 'all'
 
     Returns:
-        Formatted list of todos
+        List of todo rows
     """
     db = await get_db()
 
+    # execute_fetchall runs execute + fetchall in one worker-thread hop
     if status == "all":
-        cursor = await db.execute(
-            "SELECT * FROM todos ORDER BY priority DESC, created_at DESC"
-        )
-    else:
-        cursor = await db.execute(
-            "SELECT * FROM todos WHERE status = ? ORDER BY priority DESC, created_at DESC",
-            (status,),
-        )
+        return await db.execute_fetchall(_SQL_LIST_TODOS_ALL)
+    return await db.execute_fetchall(_SQL_LIST_TODOS_BY_STATUS, (status,))
 
-    rows = await cursor.fetchall()
 
-    if not rows:
-        return f"No {status} todos found."
+async def list_todos(status: str = "active") -> str:
+    """List todos filtered by status.
 
-    # Format output
-    result = f"\n=== {status.upper()} TODOS ===\n\n"
+    Args:
+        status: Filter by 'active', 'completed', or 'all'
 
-    # Group by priority
-    priority_groups = {"high": [], "medium": [], "low": []}
-    for row in rows:
-        priority_groups[row["priority"]].append(row)
+    Returns:
+        Formatted list of todos
+    """
+    db = await get_db()
 
-    for priority in ["high", "medium", "low"]:
-        todos = priority_groups[priority]
-        if todos:
-            result += f"{priority.upper()} PRIORITY:\n"
-            for todo in todos:
-                result += f"  [{todo['id']}] {todo['title']}\n"
-                if todo["notes"]:
-                    result += f"      Notes: {todo['notes']}\n"
-            result += "\n"
+    stamp = db.total_changes
+    cached = _result_cache.get(("todos", status))
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
 
-    return result.strip()
+    rows = await query_todos(status)
+    if not rows:
+        result = f"No {status} todos found."
+        _result_cache[("todos", status)] = (stamp, result)
+        return result
+
+    # Collect fragments and join once; += on a growing string recopies the
+    # whole buffer per append. ORDER BY priority_rank already delivers the
+    # rows contiguous per priority, so groupby streams out the sections
+    # without intermediate buckets.
+    parts = [f"\n=== {status.upper()} TODOS ===\n\n"]
+
+    # Columns arrive in (id, title, priority, notes) order; positional
+    # unpacking skips Row's per-field name lookup
+    for priority, todos in groupby(rows, key=lambda row: row[2]):
+        parts.append(f"{priority.upper()} PRIORITY:\n")
+        for todo_id, title, _, notes in todos:
+            parts.append(f"  [{todo_id}] {title}\n")
+            if notes:
+                parts.append(f"      Notes: {notes}\n")
+        parts.append("\n")
+
+    result = "".join(parts).strip()
+    _result_cache[("todos", status)] = (stamp, result)
+    return result
 
 
 async def complete_todo(todo_id: int) -> str:
@@ -219,21 +382,41 @@ async def complete_todo(todo_id: int) -> str:
     """
     db = await get_db()
 
-    # Get todo title for confirmation
-    cursor = await db.execute("SELECT title FROM todos WHERE id = ?", (todo_id,))
+    # RETURNING folds the confirmation lookup into the update itself; an
+    # empty result is the not-found case
+    cursor = await db.execute(_SQL_COMPLETE_TODO, (todo_id,))
     row = await cursor.fetchone()
+    await db.commit()
 
     if not row:
         return f"Error: Todo #{todo_id} not found."
 
-    # Mark as complete
-    await db.execute(
-        "UPDATE todos SET status = 'completed', completed_at = CURRENT_TIMESTAMP WHERE id = ?",
-        (todo_id,),
+    return f"✓ Completed: {row['title']}"
+
+
+async def bulk_complete_todos(todo_ids: list) -> int:
+    """Mark several todos complete in one statement.
+
+    Args:
+        todo_ids: IDs of the todos to mark complete
+
+    Returns:
+        Number of rows updated
+    """
+    if not todo_ids:
+        return 0
+
+    db = await get_db()
+
+    placeholders = ",".join("?" * len(todo_ids))
+    cursor = await db.execute(
+        "UPDATE todos SET status = 'completed', completed_at = CURRENT_TIMESTAMP"
+        f" WHERE id IN ({placeholders})",
+        tuple(todo_ids),
     )
     await db.commit()
 
-    return f"✓ Completed: {row['title']}"
+    return cursor.rowcount
 
 
 async def delete_todo(todo_id: int) -> str:
@@ -247,15 +430,13 @@ async def delete_todo(todo_id: int) -> str:
     """
     db = await get_db()
 
-    cursor = await db.execute("SELECT title FROM todos WHERE id = ?", (todo_id,))
+    cursor = await db.execute(_SQL_DELETE_TODO, (todo_id,))
     row = await cursor.fetchone()
+    await db.commit()
 
     if not row:
         return f"Error: Todo #{todo_id} not found."
 
-    await db.execute("DELETE FROM todos WHERE id = ?", (todo_id,))
-    await db.commit()
-
     return f"✓ Deleted: {row['title']}"
 
 
@@ -297,35 +478,41 @@ async def list_goals(status: str = "active") -> str:
     """
     db = await get_db()
 
+    stamp = db.total_changes
+    cached = _result_cache.get(("goals", status))
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
     if status == "all":
-        cursor = await db.execute("SELECT * FROM goals ORDER BY created_at DESC")
+        rows = await db.execute_fetchall(_SQL_LIST_GOALS_ALL)
     else:
-        cursor = await db.execute(
-            "SELECT * FROM goals WHERE status = ? ORDER BY created_at DESC", (status,)
-        )
-
-    rows = await cursor.fetchall()
-
-    if not rows:
-        return f"No {status} goals found."
-
-    result = f"\n=== {status.upper()} GOALS ===\n\n"
+        rows = await db.execute_fetchall(_SQL_LIST_GOALS_BY_STATUS, (status,))
 
-    # Group by timeframe
+    # Bucket rows by timeframe; columns arrive in
+    # (id, goal, timeframe, category) order
     timeframes = {}
     for row in rows:
-        tf = row["timeframe"]
+        tf = row[2]
         if tf not in timeframes:
             timeframes[tf] = []
         timeframes[tf].append(row)
 
+    if not timeframes:
+        result = f"No {status} goals found."
+        _result_cache[("goals", status)] = (stamp, result)
+        return result
+
+    parts = [f"\n=== {status.upper()} GOALS ===\n\n"]
+
     for timeframe, goals in timeframes.items():
-        result += f"{timeframe.upper()}:\n"
-        for goal in goals:
-            result += f"  [{goal['id']}] {goal['goal']} ({goal['category']})\n"
-        result += "\n"
+        parts.append(f"{timeframe.upper()}:\n")
+        for goal_id, goal, _, category in goals:
+            parts.append(f"  [{goal_id}] {goal} ({category})\n")
+        parts.append("\n")
 
-    return result.strip()
+    result = "".join(parts).strip()
+    _result_cache[("goals", status)] = (stamp, result)
+    return result
 
 
 # ============================================================================
@@ -361,31 +548,35 @@ async def get_user_context() -> str:
     """
     db = await get_db()
 
-    cursor = await db.execute(
-        "SELECT fact, category FROM user_facts ORDER BY created_at DESC LIMIT 20"
-    )
-    rows = await cursor.fetchall()
-
-    if not rows:
-        return "No user facts stored yet. Use add_user_fact() to remember important information."
-
-    result = "\n=== USER CONTEXT ===\n\n"
+    stamp = db.total_changes
+    cached = _result_cache.get("user_context")
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
 
-    # Group by category
+    rows = await db.execute_fetchall(_SQL_RECENT_FACTS)
+    # Bucket facts by category
     categories = {}
-    for row in rows:
-        cat = row["category"]
+    for fact, cat in rows:
         if cat not in categories:
             categories[cat] = []
-        categories[cat].append(row["fact"])
+        categories[cat].append(fact)
+
+    if not categories:
+        result = "No user facts stored yet. Use add_user_fact() to remember important information."
+        _result_cache["user_context"] = (stamp, result)
+        return result
+
+    parts = ["\n=== USER CONTEXT ===\n\n"]
 
     for category, facts in categories.items():
-        result += f"{category.upper()}:\n"
+        parts.append(f"{category.upper()}:\n")
         for fact in facts:
-            result += f"  - {fact}\n"
-        result += "\n"
+            parts.append(f"  - {fact}\n")
+        parts.append("\n")
 
-    return result.strip()
+    result = "".join(parts).strip()
+    _result_cache["user_context"] = (stamp, result)
+    return result
 
 
 # ============================================================================
@@ -6,9 +6,18 @@ from typing import List, Optional
 
 import aiosqlite
 
+from coach_ai.storage import (
+    TAG_DEADLINE,
+    TAG_MANAGEMENT,
+    TAG_QUICK_WIN,
+    TAG_SPRINT,
+    transaction,
+)
+
 
 async def select_tasks_for_today(
-    db: aiosqlite.Connection, target_date: date, max_tasks: int = 5
+    db: aiosqlite.Connection, target_date: date, max_tasks: int = 5,
+    todos_rows: Optional[list] = None,
 ) -> dict:
     """Select 3-5 tasks from backlog for today's daily note.
 
@@ -21,21 +30,26 @@ async def select_tasks_for_today(
         db: Database connection
         target_date: Date to select tasks for
         max_tasks: Maximum total tasks to select (default: 5)
+        todos_rows: Optional pre-fetched active todo rows (sorted oldest
+            first); skips the internal query when the caller already has them
 
     Returns:
         Dict with 'critical', 'important', 'quick_wins' lists and 'backlog_count'
     """
-    # Fetch all active todos with metadata
-    cursor = await db.execute(
-        """
-        SELECT id, title, priority, notes, time_estimate, skipped_count,
-               last_scheduled, created_at
-        FROM todos
-        WHERE status = 'active'
-        ORDER BY created_at ASC
-        """
-    )
-    all_todos = await cursor.fetchall()
+    if todos_rows is not None:
+        all_todos = todos_rows
+    else:
+        # Fetch all active todos with metadata
+        cursor = await db.execute(
+            """
+            SELECT id, title, priority, notes, time_estimate, skipped_count,
+                   last_scheduled, created_at, tags, deadline_date
+            FROM todos
+            WHERE status = 'active'
+            ORDER BY created_at ASC
+            """
+        )
+        all_todos = await cursor.fetchall()
 
     if not all_todos:
         return {
@@ -45,16 +59,40 @@ async def select_tasks_for_today(
             "backlog_count": 0,
         }
 
-    # Convert to dicts for easier handling
-    todos = [dict(row) for row in all_todos]
-
-    # Filter out tasks stuck in backlog hell (moved 5+ times)
-    todos = [t for t in todos if (t["skipped_count"] or 0) < 5]
-
-    # Categorize todos
-    critical = await _select_critical_tasks(todos, target_date)
-    important = await _select_important_tasks(todos, critical, max_important=2)
-    quick_wins = await _select_quick_wins(todos, critical + important, max_quick=3)
+    # Filter out tasks stuck in backlog hell (moved 5+ times). Rows stay
+    # aiosqlite.Row throughout selection — no per-row dict allocation; only
+    # the handful of winners are converted at return
+    todos = [row for row in all_todos if (row["skipped_count"] or 0) < 5]
+
+    # One partitioning pass feeds all three selection stages; each helper
+    # then walks only its own candidate buckets instead of re-filtering the
+    # whole backlog per sub-stage
+    buckets = {
+        "high": [],
+        "medium": [],
+        "low": [],
+        "sprint_mgmt": [],
+        "quick": [],
+        "short": [],
+    }
+    for todo in todos:
+        priority = todo["priority"]
+        if priority in buckets:
+            buckets[priority].append(todo)
+        tags = todo["tags"]
+        if tags & (TAG_SPRINT | TAG_MANAGEMENT):
+            buckets["sprint_mgmt"].append(todo)
+        if tags & TAG_QUICK_WIN:
+            buckets["quick"].append(todo)
+        if todo["time_estimate"] and todo["time_estimate"] <= 30:
+            buckets["short"].append(todo)
+
+    # Categorize todos; the helpers share one exclude set and add their own
+    # picks to it, so nothing rebuilds an "available" list between stages
+    critical = await _select_critical_tasks(todos, buckets, target_date)
+    exclude_ids = {t["id"] for t in critical}
+    important = await _select_important_tasks(buckets, exclude_ids, max_important=2)
+    quick_wins = await _select_quick_wins(buckets, exclude_ids, max_quick=3)
 
     # Limit total tasks
     selected_tasks = critical + important + quick_wins
@@ -64,157 +102,158 @@ async def select_tasks_for_today(
         if len(critical) + len(important) > max_tasks:
             important = important[: max(0, max_tasks - len(critical))]
 
-    # Update last_scheduled for selected tasks
+    # Update last_scheduled for selected tasks. executemany keeps the SQL
+    # text constant (the IN-list version changes shape with the batch size,
+    # defeating sqlite3's statement cache) at a handful of rows per day.
     selected_ids = [t["id"] for t in critical + important + quick_wins]
     if selected_ids:
-        placeholders = ",".join("?" * len(selected_ids))
-        await db.execute(
-            f"UPDATE todos SET last_scheduled = ? WHERE id IN ({placeholders})",
-            [target_date.isoformat()] + selected_ids,
-        )
-        await db.commit()
+        target_iso = target_date.isoformat()
+        async with transaction(db):
+            await db.executemany(
+                "UPDATE todos SET last_scheduled = ? WHERE id = ?",
+                [(target_iso, task_id) for task_id in selected_ids],
+            )
 
     return {
-        "critical": critical,
-        "important": important,
-        "quick_wins": quick_wins,
+        "critical": [dict(task) for task in critical],
+        "important": [dict(task) for task in important],
+        "quick_wins": [dict(task) for task in quick_wins],
         "backlog_count": len(all_todos),
     }
 
 
-async def _select_critical_tasks(todos: List[dict], target_date: date) -> List[dict]:
+async def _select_critical_tasks(
+    todos: List, buckets: dict, target_date: date
+) -> List:
     """Select 0-1 critical task with deadline or highest priority.
 
     Priority:
     1. Tasks with today's date mentioned in notes (deadlines)
     2. High priority tasks that haven't been skipped too many times
     """
-    # Look for deadline mentions
+    # Look for deadline mentions: all four date spellings compile into one
+    # alternation, so each todo's notes get a single C-level scan instead of
+    # four substring checks. The [Deadline]-tagged fallback is collected in
+    # the same pass but only wins if no date mention turns up.
     date_patterns = [
         target_date.strftime("%Y-%m-%d"),  # 2025-11-07
         target_date.strftime("%m/%d"),  # 11/07
         target_date.strftime("%B %d"),  # November 07
         target_date.strftime("%b %d"),  # Nov 07
     ]
+    date_re = re.compile("|".join(re.escape(pattern) for pattern in date_patterns))
+    target_iso = date_patterns[0]
 
+    deadline_tagged = None
     for todo in todos:
-        notes = todo.get("notes") or ""
-        if any(pattern in notes for pattern in date_patterns):
+        # Structured fast path first (migration 6); the regex scan remains
+        # for legacy rows and non-ISO date spellings in the notes
+        if todo["deadline_date"] == target_iso:
             return [todo]
-
-    # Check for [Deadline] flag
-    for todo in todos:
-        notes = todo.get("notes") or ""
-        if "[Deadline]" in notes:
+        notes = todo["notes"]
+        if notes and date_re.search(notes):
             return [todo]
+        if deadline_tagged is None and todo["tags"] & TAG_DEADLINE:
+            deadline_tagged = todo
 
-    # Fall back to highest priority that's not too stale
-    high_priority = [t for t in todos if t["priority"] == "high"]
-    high_priority.sort(key=lambda t: t.get("skipped_count", 0))
+    if deadline_tagged is not None:
+        return [deadline_tagged]
 
+    # Fall back to highest priority that's not too stale
+    high_priority = buckets["high"]
     if high_priority:
-        return [high_priority[0]]
+        return [min(high_priority, key=lambda t: t["skipped_count"] or 0)]
 
     return []
 
 
 async def _select_important_tasks(
-    todos: List[dict], exclude: List[dict], max_important: int = 2
-) -> List[dict]:
+    buckets: dict, exclude_ids: set, max_important: int = 2
+) -> List:
     """Select 1-2 important high-impact tasks.
 
     Priority:
     1. High priority tasks
-    2. Tasks with [Sprint Work] or [Management] tags
+    2. Tasks tagged as sprint or management work
     3. Medium priority tasks, oldest first
-    """
-    exclude_ids = {t["id"] for t in exclude}
-    available = [t for t in todos if t["id"] not in exclude_ids]
 
+    Works off the caller's pre-partitioned buckets. exclude_ids is shared
+    with the other selection stages: already-picked ids are skipped with a
+    set lookup per candidate, and this stage's picks are added in place.
+    """
     important = []
 
     # High priority tasks
-    high_priority = [t for t in available if t["priority"] == "high"]
-    high_priority.sort(key=lambda t: t.get("skipped_count", 0))
-    important.extend(high_priority[:max_important])
+    high_priority = [t for t in buckets["high"] if t["id"] not in exclude_ids]
+    high_priority.sort(key=lambda t: t["skipped_count"] or 0)
+    for task in high_priority[:max_important]:
+        important.append(task)
+        exclude_ids.add(task["id"])
 
     if len(important) >= max_important:
-        return important[:max_important]
+        return important
 
     # Sprint/Management work
-    exclude_ids.update(t["id"] for t in important)
-    available = [t for t in available if t["id"] not in exclude_ids]
-
-    sprint_tasks = [
-        t
-        for t in available
-        if any(
-            tag in (t.get("notes") or "")
-            for tag in ["[Sprint Work]", "[Management]"]
-        )
-    ]
-    important.extend(sprint_tasks[: max_important - len(important)])
-
-    if len(important) >= max_important:
-        return important[:max_important]
+    for task in buckets["sprint_mgmt"]:
+        if task["id"] in exclude_ids:
+            continue
+        important.append(task)
+        exclude_ids.add(task["id"])
+        if len(important) >= max_important:
+            return important
 
     # Medium priority, oldest first
-    exclude_ids.update(t["id"] for t in important)
-    available = [t for t in available if t["id"] not in exclude_ids]
-
-    medium_priority = [t for t in available if t["priority"] == "medium"]
+    medium_priority = [t for t in buckets["medium"] if t["id"] not in exclude_ids]
     medium_priority.sort(key=lambda t: t["created_at"])
-    important.extend(medium_priority[: max_important - len(important)])
+    for task in medium_priority[: max_important - len(important)]:
+        important.append(task)
+        exclude_ids.add(task["id"])
 
-    return important[:max_important]
+    return important
 
 
 async def _select_quick_wins(
-    todos: List[dict], exclude: List[dict], max_quick: int = 3
-) -> List[dict]:
+    buckets: dict, exclude_ids: set, max_quick: int = 3
+) -> List:
     """Select 2-3 quick win tasks for dopamine hits.
 
     Priority:
-    1. Tasks marked as [Quick Win]
+    1. Tasks tagged as quick wins
     2. Tasks with time_estimate <= 30 minutes
     3. Low priority tasks (often easier)
-    """
-    exclude_ids = {t["id"] for t in exclude}
-    available = [t for t in todos if t["id"] not in exclude_ids]
 
+    Works off the caller's pre-partitioned buckets and shares its
+    exclude_ids set; see _select_important_tasks.
+    """
     quick_wins = []
 
     # Explicit quick wins
-    explicit_quick = [
-        t for t in available if "[Quick Win]" in (t.get("notes") or "")
-    ]
-    quick_wins.extend(explicit_quick[:max_quick])
-
-    if len(quick_wins) >= max_quick:
-        return quick_wins[:max_quick]
+    for task in buckets["quick"]:
+        if task["id"] in exclude_ids:
+            continue
+        quick_wins.append(task)
+        exclude_ids.add(task["id"])
+        if len(quick_wins) >= max_quick:
+            return quick_wins
 
     # Time estimate based
-    exclude_ids.update(t["id"] for t in quick_wins)
-    available = [t for t in available if t["id"] not in exclude_ids]
-
-    time_based = [
-        t for t in available if t.get("time_estimate") and t["time_estimate"] <= 30
-    ]
+    time_based = [t for t in buckets["short"] if t["id"] not in exclude_ids]
     time_based.sort(key=lambda t: t["time_estimate"])
-    quick_wins.extend(time_based[: max_quick - len(quick_wins)])
+    for task in time_based[: max_quick - len(quick_wins)]:
+        quick_wins.append(task)
+        exclude_ids.add(task["id"])
 
     if len(quick_wins) >= max_quick:
-        return quick_wins[:max_quick]
+        return quick_wins
 
     # Low priority tasks
-    exclude_ids.update(t["id"] for t in quick_wins)
-    available = [t for t in available if t["id"] not in exclude_ids]
-
-    low_priority = [t for t in available if t["priority"] == "low"]
+    low_priority = [t for t in buckets["low"] if t["id"] not in exclude_ids]
     low_priority.sort(key=lambda t: t["created_at"])
-    quick_wins.extend(low_priority[: max_quick - len(quick_wins)])
+    for task in low_priority[: max_quick - len(quick_wins)]:
+        quick_wins.append(task)
+        exclude_ids.add(task["id"])
 
-    return quick_wins[:max_quick]
+    return quick_wins
 
 
 async def increment_skip_counts(
@@ -227,13 +266,9 @@ async def increment_skip_counts(
     if not task_ids:
         return
 
-    placeholders = ",".join("?" * len(task_ids))
-    await db.execute(
-        f"""
-        UPDATE todos
-        SET skipped_count = COALESCE(skipped_count, 0) + 1
-        WHERE id IN ({placeholders}) AND status = 'active'
-        """,
-        task_ids,
-    )
-    await db.commit()
+    async with transaction(db):
+        await db.executemany(
+            "UPDATE todos SET skipped_count = COALESCE(skipped_count, 0) + 1"
+            " WHERE id = ? AND status = 'active'",
+            [(task_id,) for task_id in task_ids],
+        )